@@ -0,0 +1,49 @@
+"""
+
+Models are prepared with fast access by default: fields are non-data
+descriptors, so reading an attribute of an instance doesn't call `Field`.
+This benchmark compares it with models prepared with `fast_access=False`.
+
+"""
+
+import timeit
+from dataclasses import dataclass
+
+from aiodbcore.models import Field, prepare_model
+
+ROWS = 100_000
+
+
+@dataclass
+class FastUser:
+    id: Field[int | None] = Field(None)
+    name: Field[str] = Field("")
+    age: Field[int] = Field(0)
+
+
+@dataclass
+class SlowUser:
+    id: Field[int | None] = Field(None)
+    name: Field[str] = Field("")
+    age: Field[int] = Field(0)
+
+
+prepare_model(FastUser)
+prepare_model(SlowUser, fast_access=False)
+
+
+def serialize(users) -> list[tuple]:
+    return [(user.id, user.name, user.age) for user in users]
+
+
+def main():
+    for model in (FastUser, SlowUser):
+        users = [model(i, f"user{i}", i % 100) for i in range(ROWS)]
+        seconds = min(
+            timeit.repeat(lambda: serialize(users), number=1, repeat=5)
+        )
+        print(f"{model.__name__}: {seconds * 1000:.1f} ms per {ROWS} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ class User:
     age: Field[int] = Field(0)
     moneys: ty.Annotated[Field[int], SpecificSQLType("BIGINT")] = Field(1000)
     registered_at: Field[datetime.datetime] = Field(
-        field(default_factory=datetime.datetime.now)
+        field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     )
 
 
@@ -0,0 +1,59 @@
+"""
+
+Rows of sharded model are stored by several dbs.
+Shards assign ids independently, so rows of different shards
+can have the same id: fetch them with condition on shard key.
+
+"""
+
+from dataclasses import dataclass
+
+from aiodbcore import SyncDBCore
+from aiodbcore.models import Field
+from aiodbcore.sharding import RangeShardMap
+
+
+@dataclass
+class Event:
+    id: Field[int | None] = Field(None)
+    tenant: Field[int] = Field(0)
+    name: Field[str] = Field("")
+
+
+class DB(SyncDBCore[Event]):
+    pass
+
+
+def main():
+    DB.init("sqlite+sqlite3://:memory:")
+    for shard in ("shard1", "shard2"):
+        DB.init("sqlite+sqlite3://:memory:", db_name=shard)
+        DB(shard).create_tables()
+    # tenants < 4 are stored by `shard1`, others by `shard2`
+    DB.enable_sharding(RangeShardMap(Event.tenant, [4], ["shard1", "shard2"]))
+    db = DB()
+
+    # both shards get ids 1-4
+    db.insert([Event(tenant=x, name=f"event{x}") for x in range(8)])
+
+    with db.session() as s:
+        # objects of different shards with the same id are not mixed up
+        events = s.fetchall(Event, order_by=Event.tenant)
+        print(*((event.id, event.tenant) for event in events))
+        assert [event.tenant for event in events] == list(range(8))
+        events[5].name = "renamed"
+        s.save(events[5])  # saved to `shard2` on exit
+    assert db.fetchone(Event, where=Event.tenant == 5).name == "renamed"
+    assert db.fetchone(Event, where=Event.tenant == 1).name == "event1"
+
+    try:
+        db.get(Event, 2)
+    except ValueError as err:
+        print(err)  # several shards store `Event` with id 2
+    print(db.fetchone(Event, where=(Event.tenant == 5) & (Event.id == 2)))
+
+    DB.close_connections()
+
+
+if __name__ == "__main__":
+    main()
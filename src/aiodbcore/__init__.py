@@ -1,5 +1,7 @@
+from . import codecs as codecs
 from . import joins as joins
 from . import models as models
+from . import sharding as sharding
 from . import utils as utils
 from .core_async import AsyncDBCore as AsyncDBCore
 from .core_sync import SyncDBCore as SyncDBCore
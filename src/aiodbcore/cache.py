@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+import time
+import typing as ty
+from collections import OrderedDict
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ObjectCache:
+    """
+    LRU cache of raw rows keyed by primary key.
+    Rows are stored instead of instances, so each hit builds a new object
+    and changes of returned objects do not leak into the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        """
+        :param maxsize: Max count of cached rows.
+        :param ttl: Lifetime of a row in seconds. None - unlimited.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0  # increases on every invalidation
+        self.stats = CacheStats()
+        # {obj_id: (expires_at, row)}
+        self._rows: OrderedDict[int, tuple[float | None, tuple]] = (
+            OrderedDict()
+        )
+
+    def get(self, obj_id: int) -> tuple | None:
+        """
+        :returns: cached row or None.
+        """
+        try:
+            expires_at, row = self._rows[obj_id]
+        except KeyError:
+            self.stats.misses += 1
+            return None
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._rows.pop(obj_id, None)
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+        self._rows.move_to_end(obj_id)
+        self.stats.hits += 1
+        return row
+
+    def set(
+        self,
+        obj_id: int,
+        row: ty.Sequence[ty.Any],
+        generation: int | None = None,
+    ) -> None:
+        """
+        :param obj_id: primary key.
+        :param row: raw row.
+        :param generation: `generation` before query execution.
+            Row is not cached if rows were changed during execution.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else None
+        )
+        self._rows[obj_id] = (expires_at, tuple(row))
+        self._rows.move_to_end(obj_id)
+        while len(self._rows) > self.maxsize:
+            self._rows.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, obj_id: int) -> None:
+        self.generation += 1
+        self._rows.pop(obj_id, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class QueryCache:
+    """
+    Cache of select query results keyed by query and adapted args.
+    Results are invalidated when any of the tables read by the query changes.
+    """
+
+    def __init__(
+        self, ttl: float | None = None, max_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        :param ttl: Lifetime of a result in seconds. None - unlimited.
+        :param max_bytes: Approximate max size of all cached results.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.generation = 0  # increases on every invalidation
+        self.stats = CacheStats()
+        # {key: (expires_at, size, tables, rows)}
+        self._results: OrderedDict[
+            ty.Hashable, tuple[float | None, int, tuple[str, ...], tuple]
+        ] = OrderedDict()
+        self._tables: dict[str, set[ty.Hashable]] = {}  # {table: {key, ...}}
+
+    def get(self, key: ty.Hashable) -> list[ty.Any] | None:
+        """
+        :returns: cached rows or None.
+        """
+        try:
+            expires_at, _, _, rows = self._results[key]
+        except KeyError:
+            self.stats.misses += 1
+            return None
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.stats.hits += 1
+        return list(rows)
+
+    def set(
+        self,
+        key: ty.Hashable,
+        rows: ty.Sequence[ty.Any],
+        tables: ty.Sequence[str],
+        generation: int | None = None,
+    ) -> None:
+        """
+        :param key: query and adapted args.
+        :param rows: raw rows.
+        :param tables: names of tables read by the query.
+        :param generation: `generation` before query execution.
+            Result is not cached if tables were changed during execution.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        rows = tuple(tuple(row) for row in rows)
+        if (size := _sizeof(rows)) > self.max_bytes:
+            return
+        self._remove(key)
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else None
+        )
+        self._results[key] = (expires_at, size, tuple(tables), rows)
+        self.size += size
+        for table in tables:
+            self._tables.setdefault(table, set()).add(key)
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._results)))
+            self.stats.evictions += 1
+
+    def invalidate_table(self, table: str) -> None:
+        self.generation += 1
+        for key in self._tables.pop(table, ()):
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._tables.clear()
+        self.size = 0
+
+    def _remove(self, key: ty.Hashable) -> None:
+        if (result := self._results.pop(key, None)) is None:
+            return
+        _, size, tables, _ = result
+        self.size -= size
+        for table in tables:
+            if keys := self._tables.get(table):
+                keys.discard(key)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def _sizeof(rows: tuple[tuple[ty.Any, ...], ...]) -> int:
+    """
+    Approximate size of rows in bytes.
+    """
+    return sys.getsizeof(rows) + sum(
+        sys.getsizeof(row) + sum(map(sys.getsizeof, row)) for row in rows
+    )
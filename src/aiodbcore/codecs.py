@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import dataclasses
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from .models import Compressed
+    from .providers import BaseProvider
+
+
+@dataclasses.dataclass(frozen=True)
+class Codec[T]:
+    """
+    Conversion of python type to db value and back.
+    """
+
+    python_type: ty.Type[T]
+    sql_type: str
+    """ type of column """
+    encode: ty.Callable[[T], ty.Any]
+    """
+    converts value to type supported by db driver.
+    Values of union fields are stored as JSON,
+    so result should be serializable by orjson.
+    """
+    decode: ty.Callable[[ty.Any], T]
+    """ converts value from db to python type """
+
+
+class TaggedValue:
+    """
+    Value of union field with name of its type.
+    It is stored as `[tag, value]`, so decoding doesn't guess the type.
+    """
+
+    __slots__ = ("tag", "value")
+
+    def __init__(self, tag: str, value: ty.Any):
+        self.tag = tag
+        self.value = value
+
+    def __repr__(self):
+        return f"<TaggedValue {self.tag}:{self.value!r}>"
+
+
+class JsonValue:
+    """
+    Value of JSON field (dict, list or dataclass).
+    It is stored as `JSON_FIELD_TYPE` of provider, values of other fields
+    are serialized to `DEFAULT_FIELD_TYPE`.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: ty.Any):
+        self.value = value
+
+    def __repr__(self):
+        return f"<JsonValue {self.value!r}>"
+
+
+class CompressedValue:
+    """
+    Value of field with `Compressed` modifier.
+    It is serialized by provider and then compressed.
+    """
+
+    __slots__ = ("value", "compressed")
+
+    def __init__(self, value: ty.Any, compressed: Compressed):
+        self.value = value
+        self.compressed = compressed
+
+    def __repr__(self):
+        return f"<CompressedValue {self.value!r}>"
+
+
+_registry: dict[type[BaseProvider] | None, dict[type, Codec]] = {}
+generation = 0
+""" increases on every registration, providers reset compiled codecs """
+
+
+def register_codec[T](
+    python_type: ty.Type[T],
+    sql_type: str,
+    encode: ty.Callable[[T], ty.Any],
+    decode: ty.Callable[[ty.Any], T],
+    *,
+    provider: type[BaseProvider] | None = None,
+) -> Codec[T]:
+    """
+    Registers conversion of custom type.
+
+    >>> register_codec(Money, "TEXT", str, Money.parse)
+    >>> register_codec(
+    ...     Money, "NUMERIC", Money.to_decimal, Money, provider=AsyncpgProvider
+    ... )
+
+    :param python_type: type of field.
+    :param sql_type: type of column.
+    :param encode: converts value to type supported by db driver.
+    :param decode: converts value from db to `python_type`.
+    :param provider: provider class which uses this codec (and its subclasses).
+        None - all providers.
+    """
+    global generation
+    codec = Codec(python_type, sql_type, encode, decode)
+    _registry.setdefault(provider, {})[python_type] = codec
+    generation += 1
+    return codec
+
+
+def unregister_codec(
+    python_type: type, *, provider: type[BaseProvider] | None = None
+) -> None:
+    global generation
+    if _registry.get(provider, {}).pop(python_type, None) is not None:
+        generation += 1
+
+
+def get_codec(
+    provider: type[BaseProvider], python_type: ty.Any
+) -> Codec | None:
+    """
+    :returns: codec of `python_type` registered for `provider`,
+        its base classes or all providers.
+    """
+    for klass in (*provider.__mro__, None):
+        if (codecs := _registry.get(klass)) is not None and (
+            codec := codecs.get(python_type)
+        ) is not None:
+            return codec
+    return None
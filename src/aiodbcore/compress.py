@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import typing as ty
+import zlib
+
+try:
+    from compression import zstd  # python 3.14+
+
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        return zstd.compress(data, level)
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return zstd.decompress(data)
+
+except ImportError:
+    try:
+        import zstandard
+
+        def _zstd_compress(data: bytes, level: int) -> bytes:
+            return zstandard.ZstdCompressor(level=level).compress(data)
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            return zstandard.ZstdDecompressor().decompress(data)
+
+    except ImportError:
+        _zstd_compress = _zstd_decompress = None  # type: ignore
+
+
+ALGORITHMS = ("none", "zlib", "zstd")
+""" index of algorithm is stored in the header of value """
+DEFAULT_LEVELS = {"zlib": 6, "zstd": 3}
+
+_TEXT_FLAG = 1
+_MAX_HEADER = len(ALGORITHMS) * 2 - 1
+"""
+Header byte is `algorithm index * 2 + text flag`.
+Serialized values never start with these bytes,
+so values stored before compression was enabled are recognized.
+"""
+
+
+def is_zstd_available() -> bool:
+    return _zstd_compress is not None
+
+
+def pack(
+    data: bytes | str,
+    algorithm: str = "zstd",
+    level: int | None = None,
+    threshold: int = 0,
+) -> bytes:
+    """
+    Compresses data and prepends header.
+    :param data: serialized value.
+    :param algorithm: `zstd` or `zlib`.
+        zlib is used if zstd is not available.
+    :param level: compression level. None - default level of algorithm.
+    :param threshold: data shorter than threshold is not compressed.
+    """
+    flag = 0
+    if isinstance(data, str):
+        data, flag = data.encode(), _TEXT_FLAG
+    if len(data) < threshold:
+        algorithm = "none"
+    elif algorithm == "zstd" and not is_zstd_available():
+        algorithm = "zlib"
+    if level is None:
+        level = DEFAULT_LEVELS.get(algorithm, 0)
+    if algorithm == "zstd":
+        data = _zstd_compress(data, level)
+    elif algorithm == "zlib":
+        data = zlib.compress(data, level)
+    elif algorithm != "none":
+        raise ValueError(f"Unknown compression algorithm: {algorithm}")
+    return bytes((ALGORITHMS.index(algorithm) * 2 + flag,)) + data
+
+
+def is_packed(data: ty.Any) -> bool:
+    """
+    Checks `data` is result of `pack`.
+    """
+    return isinstance(data, bytes) and bool(data) and data[0] <= _MAX_HEADER
+
+
+def unpack(data: bytes) -> bytes | str:
+    """
+    Decompresses result of `pack`.
+    """
+    header, data = data[0], data[1:]
+    algorithm = ALGORITHMS[header // 2]
+    if algorithm == "zstd":
+        if not is_zstd_available():
+            raise RuntimeError(
+                "You should install `zstandard` to read values "
+                "compressed by zstd. Use `pip install zstandard`"
+            )
+        data = _zstd_decompress(data)
+    elif algorithm == "zlib":
+        data = zlib.decompress(data)
+    if header & _TEXT_FLAG:
+        return data.decode()
+    return data
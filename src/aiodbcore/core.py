@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import copy
+import heapq
+import itertools
+import operator
 import types as tys
 import typing as ty
 from abc import ABC, abstractmethod
+from inspect import getattr_static
 
+from .cache import ObjectCache, QueryCache
 from .models import Field, prepare_model
-from .operators import MathOperator
+from .operators import FullTextRank, InvertedField, MathOperator, Subquery
 from .providers import get_provider
-from .tools import get_base_generics, get_changed_attributes
+from .routing import ReplicaRouter
+from .sharding import ShardMap
+from .session import Session
+from .tools import LazyValue, get_base_generics, get_changed_attributes
 
 if ty.TYPE_CHECKING:
-    from .joins import InnerJoin, Join, LeftJoin, RightJoin
+    from .cache import CacheStats
+    from .joins import InnerJoin, Join, LeftJoin, Prefetch, RightJoin
     from .models import ModelSignature
-    from .operators import InvertedField, Operator
+    from .operators import Operator
     from .providers import BaseProvider
 
 
@@ -25,9 +35,27 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
 
     _use_async: bool
 
+    IN_CHUNK_SIZE = 500
+    """ max count of values in one `IN (...)` statement """
+
     signatures: dict[str, ModelSignature] = {}
     dbs: dict[str, ProviderT] = {}  # {db_name: provider}
     db_names: dict[str, str] = {}  # {db_name: db_path}
+    object_caches: dict[tuple[str, str], ObjectCache] = {}
+    # {(db_name, model_name): cache}
+    query_caches: dict[str, QueryCache] = {}  # {db_name: cache}
+    routers: dict[str, ReplicaRouter] = {}  # {db_name: replica router}
+    shard_maps: dict[str, ShardMap] = {}  # {model_name: shard map}
+
+    scoped_providers: bool = False
+    """
+    each event loop (`AsyncDBCore`) or thread (`SyncDBCore`) uses
+    its own provider instances, so connections are not shared between them.
+    False - all of them use provider created by `init`.
+    """
+
+    _session: Session | None = None
+    _writes: dict[str, int] = {}  # {db_name: count of writes}
 
     @classmethod
     def init(
@@ -73,9 +101,361 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
     def __init__(self, db: str = "main"):
         if not self.dbs:
             raise RuntimeError("DB is not initialized")
-        if not (provider := self.dbs.get(db)):
+        if db not in self.dbs:
             raise ValueError(f"DB `{db}` is not initialized")
-        self.provider: ProviderT = provider
+        self.db_name = db
+
+    @property
+    def provider(self) -> ProviderT:
+        """
+        Provider of db used by current event loop or thread.
+        """
+        return self._get_provider(self.db_name)
+
+    @classmethod
+    def _get_provider(cls, db_name: str) -> ProviderT:
+        provider = cls.dbs[db_name]
+        if (
+            not cls.scoped_providers
+            or (providers := cls._get_scoped_providers()) is None
+        ):
+            return provider
+        if (scoped := providers.get(db_name)) is None:
+            scoped = providers[db_name] = type(provider)(
+                cls.db_names[db_name], **provider.connection_kwargs
+            )
+        return scoped
+
+    @classmethod
+    @abstractmethod
+    def _get_scoped_providers(cls) -> dict[str, ProviderT] | None:
+        """
+        :returns: {db_name: provider} of current event loop or thread.
+            None - there is no scope, provider created by `init` is used.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def enable_cache(
+        cls,
+        model: ty.Type[Models],
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        db_name: str = "main",
+    ) -> None:
+        """
+        Enables primary key cache of model used by `get`.
+        Cache is invalidated by `insert`, `save`, `update` and `delete`.
+        :param model: model to cache.
+        :param maxsize: max count of cached rows.
+        :param ttl: lifetime of cached row in seconds. None - unlimited.
+        :param db_name: connection name.
+        """
+        cls.object_caches[(db_name, model.__name__)] = ObjectCache(
+            maxsize, ttl
+        )
+
+    @classmethod
+    def enable_query_cache(
+        cls,
+        ttl: float | None = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        db_name: str = "main",
+    ) -> None:
+        """
+        Enables cache of `fetchall` results.
+        Results are invalidated when `insert`, `save`, `update`, `delete`
+        or `drop_table` touches any of the tables read by the query.
+        Note: queries passed to `execute` directly do not invalidate cache.
+        :param ttl: lifetime of cached result in seconds. None - unlimited.
+        :param max_bytes: approximate max size of all cached results.
+        :param db_name: connection name.
+        """
+        cls.query_caches[db_name] = QueryCache(ttl, max_bytes)
+
+    @classmethod
+    def enable_replicas(
+        cls,
+        replicas: ty.Sequence[str],
+        strategy: str = "round_robin",
+        sticky: float | None = None,
+        db_name: str = "main",
+    ) -> None:
+        """
+        Routes read queries (`get`, `fetchone`, `fetchall`, `count`, `sum`)
+        of db to replicas. Other queries are executed by db itself.
+        :param replicas: names of replica dbs passed to `init`.
+        :param strategy: `round_robin` or `least_busy`
+            (replica with the least count of running queries).
+        :param sticky: reads go to primary within this count of seconds
+            after `insert`, `save`, `update` or `delete`,
+            so written rows are visible. None - always read from replicas.
+        :param db_name: connection name of primary db.
+        """
+        for name in (db_name, *replicas):
+            if name not in cls.db_names:
+                raise ValueError(f"DB `{name}` is not initialized")
+        cls.routers[db_name] = ReplicaRouter(replicas, strategy, sticky)
+
+    @classmethod
+    def enable_sharding(cls, shard_map: ShardMap) -> None:
+        """
+        Distributes rows of model between dbs.
+        `insert` and `save` write objects to their shards.
+        Queries which `where` compares shard key with `==` or `contained`
+        are executed by matching shards, other queries - by all shards.
+        Instance of shard db executes queries without shard key itself.
+        Results of several shards are merged by `order_by`,
+        `count` and `sum` are added up.
+        :param shard_map: `HashShardMap` or `RangeShardMap`.
+        """
+        for name in shard_map.shards:
+            if name not in cls.db_names:
+                raise ValueError(f"DB `{name}` is not initialized")
+        cls.shard_maps[shard_map.model_name] = shard_map
+
+    def query_cache_stats(self) -> CacheStats | None:
+        """
+        :returns: hit, miss and eviction counters of query cache
+            or None if cache is not enabled.
+        """
+        if (cache := self.query_caches.get(self.db_name)) is not None:
+            return cache.stats
+
+    def cache_stats(self, model: ty.Type[Models]) -> CacheStats | None:
+        """
+        :returns: hit, miss and eviction counters of model cache
+            or None if cache is not enabled.
+        """
+        if (cache := self._get_object_cache(model.__name__)) is not None:
+            return cache.stats
+
+    def _get_object_cache(self, model_name: str) -> ObjectCache | None:
+        return self.object_caches.get((self.db_name, model_name))
+
+    def _using(self, db_name: str) -> ty.Self:
+        """
+        :returns: copy of this instance that works with another db.
+        """
+        db = copy.copy(self)
+        db.db_name = db_name
+        return db
+
+    def _get_object_shard_db(self, obj: Models) -> ty.Self | None:
+        """
+        :returns: db of shard which stores object
+            or None if it is stored by this db.
+        """
+        if (shard_map := self.shard_maps.get(type(obj).__name__)) is None:
+            return None
+        self._check_shard_key(shard_map, obj)
+        shard = shard_map.get_object_shard(obj)
+        return self._using(shard) if shard != self.db_name else None
+
+    def _check_shard_key(self, shard_map: ShardMap, obj: Models) -> None:
+        """
+        Shards assign ids independently, so saving object with changed
+        shard key could overwrite other row with the same id.
+        :raises ValueError: shard key of saved object is changed.
+        """
+        if (
+            self.signatures[type(obj).__name__].track_changes
+            and shard_map.field.name in get_changed_attributes(obj)
+        ):
+            raise ValueError(
+                f"Shard key `{type(obj).__name__}.{shard_map.field.name}` "
+                f"of saved object can't be changed, "
+                f"insert new object and delete old one"
+            )
+
+    def _get_shard_dbs(
+        self, model_name: str, where: Operator | None = None
+    ) -> list[ty.Self] | None:
+        """
+        :param where: filtering statement of query.
+        :returns: dbs of shards which can store matching rows
+            or None if query should be executed by this db.
+        """
+        if (shard_map := self.shard_maps.get(model_name)) is None:
+            return None
+        if (shards := shard_map.get_query_shards(where)) is None:
+            if self.db_name in shard_map.shards:
+                return None
+            shards = set(shard_map.shards)
+        if shards == {self.db_name}:
+            return None
+        return [
+            self._using(shard) for shard in shard_map.shards if shard in shards
+        ]
+
+    def _prepare_shard_select_query(
+        self,
+        model: ty.Type[Models],
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[tuple[str, ...], str, ty.Sequence[ty.Any]]:
+        """
+        Prepares select query executed by one of several shards.
+        Each shard returns first `limit + offset` rows,
+        offset is applied after merging.
+        :returns: names of tables read by query, query and its args.
+        """
+        return (
+            self._get_query_tables(model, join, where),
+            *self._prepare_select_query(
+                model.__name__,
+                None,
+                join,
+                where,
+                order_by,
+                limit + offset if limit is not None else None,
+            ),
+        )
+
+    def _merge_shard_rows(
+        self,
+        model_name: str,
+        join: Join[Models] | tuple[Join[Models], ...] | None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ),
+        limit: int | None,
+        offset: int,
+        results: ty.Sequence[tuple[ty.Self, list[tuple[ty.Any, ...]]]],
+    ) -> list[tuple[ty.Self, tuple[ty.Any, ...]]]:
+        """
+        Merges rows sorted by shards.
+        :param results: shard dbs and rows fetched from them.
+        :returns: rows with dbs which fetched them.
+        """
+        if order_by is None:
+            merged = (
+                (None, row, db) for db, rows in results for row in rows
+            )
+        else:
+            columns = self._get_merge_columns(model_name, join, order_by)
+            streams = [
+                self._get_sorted_stream(db, rows, columns)
+                for db, rows in results
+            ]
+            merged = heapq.merge(*streams, key=operator.itemgetter(0))
+        return [
+            (db, row)
+            for _, row, db in itertools.islice(
+                merged, offset, offset + limit if limit is not None else None
+            )
+        ]
+
+    def _get_merge_columns(
+        self,
+        model_name: str,
+        join: Join[Models] | tuple[Join[Models], ...] | None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+        ),
+    ) -> list[tuple[int, Field, bool]]:
+        """
+        :returns: index in row, field and descending flag
+            of each `order_by` item.
+        """
+        fields = self._get_select_fields(model_name, join)
+        indexes = {str(field): i for i, field in enumerate(fields)}
+        columns = []
+        for item in order_by if isinstance(order_by, tuple) else (order_by,):
+            if (index := indexes.get(str(item))) is None or isinstance(
+                item, FullTextRank
+            ):
+                raise ValueError(
+                    f"Rows of several shards can't be sorted by `{item}`, "
+                    "sort by fields of fetched models"
+                )
+            columns.append(
+                (index, fields[index], isinstance(item, InvertedField))
+            )
+        return columns
+
+    @staticmethod
+    def _get_sorted_stream[DB: BaseDBCore](
+        db: DB,
+        rows: list[tuple[ty.Any, ...]],
+        columns: list[tuple[int, Field, bool]],
+    ) -> ty.Iterator[tuple[tuple[ty.Any, ...], tuple[ty.Any, ...], DB]]:
+        """
+        :returns: rows of shard with their sort keys.
+            Values are decoded, so shards of different providers are merged.
+            None is greater than other values, like NULL in postgresql
+            and `null` which is stored instead of NULL in sqlite.
+        """
+        decoders = [
+            (index, db.provider.get_decoder(field), desc)
+            for index, field, desc in columns
+        ]
+        for row in rows:
+            key = []
+            for index, decoder, desc in decoders:
+                value = row[index]
+                if value is not None:
+                    value = decoder(value)
+                item = (value is None, value)
+                key.append(_Descending(item) if desc else item)
+            yield tuple(key), row, db
+
+    def _split_by_shard(
+        self, objs: list[Models]
+    ) -> dict[str, list[Models]] | None:
+        """
+        Groups objects by shard.
+        :returns: {db_name: objs} or None if all objects are stored by this db.
+        """
+        groups: dict[str, list[Models]] = {}
+        for obj in objs:
+            if (shard_map := self.shard_maps.get(type(obj).__name__)) is None:
+                shard = self.db_name
+            else:
+                shard = shard_map.get_object_shard(obj)
+            groups.setdefault(shard, []).append(obj)
+        return None if groups.keys() <= {self.db_name} else groups
+
+    @staticmethod
+    def _get_unique_shard_object(
+        model: ty.Type[Models], obj_id: int, objs: list[Models]
+    ) -> Models | None:
+        """
+        :param objs: objects found by id in several shards.
+        :returns: the only found object or None.
+        :raises ValueError: several shards store rows with this id.
+        """
+        if len(objs) > 1:
+            raise ValueError(
+                f"Several shards store `{model.__name__}` with id {obj_id}, "
+                "ids are not unique across shards, "
+                "fetch it with condition on shard key"
+            )
+        return objs[0] if objs else None
+
+    def session(self) -> Session[ty.Self]:
+        """
+        Opens unit of work scope.
+        Rows with the same id resolve to the same instance
+        and `save` calls are batched until flush.
+        """
+        return Session(self)
 
     @classmethod
     @abstractmethod
@@ -111,15 +491,30 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def get(self, model: ty.Type[Models], obj_id: int, /):
+        """
+        Fetches one row by primary key.
+        Uses model cache if it is enabled by `enable_cache`.
+        :param model: model to fetch.
+        :param obj_id: id of row.
+        :returns: one model or None.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def fetchone(
         self,
         model: ty.Type[Models],
         *,
-        join: Join[Models] | None = None,
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -127,7 +522,7 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         """
         Fetches one row from db.
         :param model: model to fetch.
-        :param join: join statement.
+        :param join: join statement or chain of joins.
         :param where: filtering statement.
         :param order_by: field for sorting.
         :param limit: count of rows to fetch.
@@ -141,26 +536,52 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         self,
         model: ty.Type[Models],
         *,
-        join: Join[Models] | None = None,
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ):
         """
         Fetches all rows from db.
         :param model: model to fetch.
-        :param join: join statement.
+        :param join: join statement or chain of joins.
         :param where: filtering statement.
         :param order_by: field for sorting..
         :param limit: count of rows to fetch.
         :param offset: offset of rows to fetch.
+        :param prefetch: relations to load by separate queries.
         :returns: list of model or empty list.
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def count(self, model: ty.Type[Models], *, where: Operator | None = None):
+        """
+        Counts rows.
+        :param model: model to count.
+        :param where: filtering statement.
+        :returns: count of rows.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def sum[T](self, field: Field[T], *, where: Operator | None = None):
+        """
+        Sums values of field.
+        :param field: field of model, e.g. `User.balance`.
+        :param where: filtering statement.
+        :returns: sum of values or None if there are no rows.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def save(self, obj: Models, /):
         """
@@ -169,6 +590,15 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def flush(self):
+        """
+        Saves all objects that were passed to `save` inside the session.
+        Objects of each db are saved in one transaction, if it fails
+        they stay in the session. Shards are committed separately.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def update[T](
         self,
@@ -209,29 +639,78 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
                 field.name: (
                     field.python_type,
                     field.unique,
-                    field.sql_type,
+                    (
+                        self.provider.DEFAULT_FIELD_TYPE
+                        if field.compressed is not None
+                        and field.sql_type is None
+                        else field.sql_type
+                    ),
                 )
                 for field in signature.fields
             },
         )
 
         index_queries = []
-        indexes = {}
+        indexes: dict[str, dict[str, ty.Any]] = {}
         for field in signature.fields:
             if not (index := field.index):
                 continue
             if index.name not in indexes:
-                indexes[index.name] = {"fields": [], "unique": False}
-            indexes[index.name]["fields"].append(field.name)
+                indexes[index.name] = {
+                    "fields": [],
+                    "unique": False,
+                    "where": None,
+                    "include": [],
+                    "using": None,
+                }
+            index_info = indexes[index.name]
+            column = (
+                index.expression.format(field.name)
+                if index.expression
+                else field.name
+            )
+            if index.desc:
+                column = f"{column} DESC"
+            index_info["fields"].append(column)
             if index.unique:
-                indexes[index.name]["unique"] = True
+                index_info["unique"] = True
+            if index.where is not None:
+                index_info["where"] = (
+                    index.where()
+                    if callable(index.where)
+                    else index.where
+                )
+            if index.using is not None:
+                index_info["using"] = index.using
+            index_info["include"].extend(
+                x.name if isinstance(x, Field) else x for x in index.include
+            )
         for index_name, index_info in indexes.items():
+            where = index_info["where"]
             index_queries.append(
                 self.provider.prepare_create_index_query(
                     table_name=signature.name,
                     index_name=index_name,
                     field_names=index_info["fields"],
                     unique=index_info["unique"],
+                    where=str(where) if where is not None else None,
+                    where_values=(
+                        where.get_values() if where is not None else ()
+                    ),
+                    include=index_info["include"],
+                    using=index_info["using"],
+                )
+            )
+
+        full_text_fields = {
+            field.name: field.full_text
+            for field in signature.fields
+            if field.full_text is not None
+        }
+        if full_text_fields:
+            index_queries.extend(
+                self.provider.prepare_full_text_queries(
+                    signature.name, full_text_fields
                 )
             )
 
@@ -252,47 +731,191 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         for obj in objs:
             for field in signature.fields:
                 if field.name != "id":
-                    values.append(getattr(obj, field.name))
+                    values.append(field.dump(getattr(obj, field.name)))
         query = self.provider.prepare_insert_query(
             signature.name, field_names, len(objs)
         )
         return query, values
 
+    def _prepare_copy_records(
+        self, objs: list[Models]
+    ) -> tuple[str, list[str], list[tuple[ty.Any, ...]]]:
+        """
+        :returns: table name, field names and rows for `copy_records`.
+        """
+        signature = self.signatures[objs[0].__class__.__name__]
+        fields = [field for field in signature.fields if field.name != "id"]
+        rows = [
+            tuple(field.dump(getattr(obj, field.name)) for field in fields)
+            for obj in objs
+        ]
+        return signature.name, [field.name for field in fields], rows
+
     def _prepare_select_query(
         self,
         model_name: str,
         fields: tuple[Field | str, ...] | None = None,
-        join: Join[Models] | None = None,
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
     ) -> tuple[str, ty.Sequence[ty.Any]]:
+        joins = self._get_joins(join)
         if not fields:
-            fields = (
-                *self.signatures[model_name].fields,
-                *(self.signatures[join.model.__name__].fields if join else ()),
-            )
-        if order_by and not isinstance(order_by, tuple):
-            order_by = (order_by,)
+            fields = self._get_select_fields(model_name, join)
         return self.provider.prepare_select_query(
             model_name,
             fields=tuple(str(x) for x in fields),
-            join=str(join) if join else None,
+            join=" ".join(map(str, joins)) if joins else None,
             where=str(where) if where is not None else None,
-            order_by=(
-                tuple(
-                    (str(x) if isinstance(x, Field) else (str(x), True))
-                    for x in order_by
-                )
-                if order_by is not None
-                else None
-            ),
+            order_by=self._prepare_order_by(order_by),
             limit=limit,
             offset=offset,
-        ), where.get_values() if where is not None else ()
+        ), (
+            *(where.get_values() if where is not None else ()),
+            *self._get_order_by_values(order_by),
+        )
+
+    def _prepare_aggregate_query(
+        self, model_name: str, expression: str, where: Operator | None = None
+    ) -> tuple[tuple[str, ...], str, ty.Sequence[ty.Any]]:
+        """
+        :returns: names of tables read by query, query and its args.
+        """
+        return (
+            (
+                model_name,
+                *(where.get_subquery_tables() if where is not None else ()),
+            ),
+            *self._prepare_select_query(model_name, (expression,), where=where),
+        )
+
+    def _get_select_fields(
+        self,
+        model_name: str,
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
+    ) -> tuple[Field, ...]:
+        """
+        :returns: fields of model and joined models in order of row.
+        """
+        return (
+            *self.signatures[model_name].fields,
+            *(
+                join[field]
+                for join in self._get_joins(join)
+                for field in self.signatures[join.model.__name__].fields
+            ),
+        )
+
+    @staticmethod
+    def _prepare_order_by(
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ),
+    ) -> tuple[str | tuple[str, bool], ...] | None:
+        if order_by is None:
+            return None
+        if not isinstance(order_by, tuple):
+            order_by = (order_by,)
+        return tuple(
+            (
+                (str(x), True)
+                if isinstance(x, InvertedField)
+                else str(x)
+            )
+            for x in order_by
+        )
+
+    @staticmethod
+    def _get_order_by_values(
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ),
+    ) -> tuple[ty.Any, ...]:
+        """
+        :returns: params of sorting expressions (e.g. full-text rank).
+        """
+        if order_by is None:
+            return ()
+        if not isinstance(order_by, tuple):
+            order_by = (order_by,)
+        return tuple(
+            value
+            for x in order_by
+            if isinstance(x, FullTextRank)
+            for value in x.get_values()
+        )
+
+    def subquery(
+        self,
+        fields: Field | tuple[Field | str, ...],
+        *,
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Subquery:
+        """
+        Prepares select query that can be used as operand
+        of `Field.contained` and `utils.exists`.
+        >>> Order.user_id.contained(db.subquery(User.id, where=User.age > 20))
+        :param fields: fields to select. Table is taken from the first field.
+        :param join: join statement or chain of joins.
+        :param where: filtering statement.
+            Fields of outer query can be used for correlation.
+        :param order_by: field for sorting.
+        :param limit: count of rows to fetch.
+        :param offset: offset of rows to fetch.
+        """
+        if not isinstance(fields, tuple):
+            fields = (fields,)
+        if not isinstance(model_field := fields[0], Field):
+            raise ValueError("first field must be field of registered model")
+        model_name = model_field.model_name
+        joins = self._get_joins(join)
+        return Subquery(
+            self.provider.prepare_select_query(
+                model_name,
+                fields=tuple(str(x) for x in fields),
+                join=" ".join(map(str, joins)) if joins else None,
+                where=str(where) if where is not None else None,
+                order_by=self._prepare_order_by(order_by),
+                limit=limit,
+                offset=offset,
+                paste_placeholders=False,
+            ),
+            (
+                *(where.get_values() if where is not None else ()),
+                *self._get_order_by_values(order_by),
+            ),
+            (
+                model_name,
+                *(x.model.__name__ for x in joins),
+                *(where.get_subquery_tables() if where is not None else ()),
+            ),
+        )
 
     def _prepare_update_query[T](
         self,
@@ -313,8 +936,10 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
             ),
             (
                 *(
-                    value.value if isinstance(value, MathOperator) else value
-                    for value in fields.values()
+                    value.value
+                    if isinstance(value, MathOperator)
+                    else field.dump(value)
+                    for field, value in fields.items()
                 ),
                 *(where.get_values() if where is not None else ()),
             ),
@@ -323,18 +948,56 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
     def _prepare_save_query(
         self, obj: Models
     ) -> tuple[str, ty.Sequence[ty.Any]] | None:
-        if not (changed_field_names := get_changed_attributes(obj)):
-            return
         model = obj.__class__
-        return self._prepare_update_query(
-            model,
-            {
+        signature = self.signatures[model.__name__]
+        if not signature.track_changes:
+            changed_field_names = tuple(
+                field.name for field in signature.fields if field.is_loaded(obj)
+            )
+        elif not (changed_field_names := get_changed_attributes(obj)):
+            return
+        field_names = {field.name for field in signature.fields}
+        if not (
+            fields := {
                 getattr(model, field_name): getattr(obj, field_name)
                 for field_name in changed_field_names
-                if field_name != "id"
-            },
-            model.id == obj.id,
-        )
+                if field_name != "id" and field_name in field_names
+            }
+        ):
+            return
+        return self._prepare_update_query(model, fields, model.id == obj.id)
+
+    def _prepare_flush_batches(
+        self, objs: list[Models]
+    ) -> list[tuple[ty.Self, list[Models], list[tuple[str, list]]]]:
+        """
+        Prepares save queries of session objects of each shard.
+        :returns: [(db, objs, queries), ...], queries of one db
+            are executed in one transaction.
+        """
+        groups = self._split_by_shard(objs) or {self.db_name: objs}
+        batches = []
+        for db_name, group in groups.items():
+            db = self if db_name == self.db_name else self._using(db_name)
+            batches.append(
+                (db, group, list(db._prepare_flush_queries(group).items()))
+            )
+        return batches
+
+    def _prepare_flush_queries(
+        self, objs: list[Models]
+    ) -> dict[str, list[ty.Sequence[ty.Any]]]:
+        """
+        Groups save queries of objects by query text.
+        """
+        queries: dict[str, list[ty.Sequence[ty.Any]]] = {}
+        for obj in objs:
+            shard_map = self.shard_maps.get(type(obj).__name__)
+            if shard_map is not None:
+                self._check_shard_key(shard_map, obj)
+            if (query := self._prepare_save_query(obj)) is not None:
+                queries.setdefault(query[0], []).append(query[1])
+        return queries
 
     def _prepare_delete_query(
         self, model: ty.Type[Models], where: Operator | None
@@ -349,6 +1012,178 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
     def _prepare_drop_table_query(self, model: ty.Type[Models]) -> str:
         return self.provider.prepare_drop_table_query(model.__name__)
 
+    def _prepare_drop_full_text_queries(
+        self, model: ty.Type[Models]
+    ) -> list[str]:
+        if not any(
+            field.full_text is not None
+            for field in self.signatures[model.__name__].fields
+        ):
+            return []
+        return self.provider.prepare_drop_full_text_queries(model.__name__)
+
+    def _get_cached(
+        self, model: ty.Type[Models], obj_id: int
+    ) -> Models | None:
+        """
+        Looks for object in the session and in the model cache.
+        """
+        if self._session is not None and (
+            obj := self._session.identity_map.get(
+                self.db_name, model.__name__, obj_id
+            )
+        ):
+            return obj
+        cache = self._get_object_cache(model.__name__)
+        if cache is not None and (data := cache.get(obj_id)) is not None:
+            return self._convert_data(model, data)
+
+    def _get_cache_generation(self, model: ty.Type[Models]) -> int | None:
+        """
+        :returns: generation of model cache, it should be taken
+            before reading row passed to `_cache_row`.
+        """
+        if (cache := self._get_object_cache(model.__name__)) is not None:
+            return cache.generation
+
+    def _cache_row(
+        self,
+        model: ty.Type[Models],
+        obj_id: int,
+        data: ty.Sequence[ty.Any],
+        generation: int | None,
+    ) -> None:
+        if (cache := self._get_object_cache(model.__name__)) is not None:
+            cache.set(obj_id, data, generation)
+
+    def _prepare_prefetch_queries(
+        self, prefetch: Prefetch, parents: list[ty.Any]
+    ) -> list[tuple[str, ty.Sequence[ty.Any]]]:
+        """
+        :returns: `WHERE field IN (...)` queries split into chunks.
+        :raises TypeError: loaded objects can't be set to parent attribute.
+        """
+        if (
+            parents
+            and not hasattr(parents[0], "__dict__")
+            and not hasattr(
+                getattr_static(type(parents[0]), prefetch.to, None), "__set__"
+            )
+        ):
+            raise TypeError(
+                f"Unable to prefetch to `{prefetch.to}`: instances of "
+                f"`{type(parents[0]).__name__}` have no `__dict__`"
+            )
+        values = list(
+            dict.fromkeys(
+                value
+                for parent in parents
+                if (value := getattr(parent, prefetch.parent_field.name))
+                is not None
+            )
+        )
+        return [
+            self._prepare_select_query(
+                prefetch.model.__name__,
+                where=prefetch.field.contained(
+                    values[i : i + self.IN_CHUNK_SIZE]
+                ),
+            )
+            for i in range(0, len(values), self.IN_CHUNK_SIZE)
+        ]
+
+    @staticmethod
+    def _get_prefetch_parents(
+        prefetch: Prefetch, objs: list[ty.Any]
+    ) -> list[ty.Any]:
+        """
+        :returns: objects of parent model. Supports rows of joined models.
+        """
+        if not isinstance(next(iter(objs), None), tuple):
+            return objs
+        model_name = prefetch.parent_field.model_name
+        return [
+            obj
+            for row in objs
+            for obj in row
+            if obj is not None and obj.__class__.__name__ == model_name
+        ]
+
+    @staticmethod
+    def _attach_prefetched(
+        prefetch: Prefetch, parents: list[ty.Any], objs: list[ty.Any]
+    ) -> None:
+        """
+        Sets loaded objects to parent attributes.
+        """
+        index: dict[ty.Any, list[ty.Any]] = {}
+        for obj in objs:
+            index.setdefault(getattr(obj, prefetch.field.name), []).append(obj)
+        for parent in parents:
+            related = index.get(getattr(parent, prefetch.parent_field.name), [])
+            if prefetch.many:
+                setattr(parent, prefetch.to, list(related))
+            else:
+                setattr(parent, prefetch.to, related[0] if related else None)
+
+    def _query_cache_key(
+        self, query: str, args: ty.Sequence[ty.Any]
+    ) -> tuple[str, tuple[ty.Any, ...]] | None:
+        """
+        :returns: key of query cache or None if query can't be cached.
+        """
+        adapt_value = self.provider.adapt_value
+        key = (query, tuple(adapt_value(arg) for arg in args))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _get_joins(
+        join: Join[Models] | tuple[Join[Models], ...] | None,
+    ) -> tuple[Join[Models], ...]:
+        if join is None:
+            return ()
+        return join if isinstance(join, tuple) else (join,)
+
+    def _get_query_tables(
+        self,
+        model: ty.Type[Models],
+        join: Join[Models] | tuple[Join[Models], ...] | None = None,
+        where: Operator | None = None,
+    ) -> tuple[str, ...]:
+        """
+        :returns: names of tables read by select query.
+        """
+        return (
+            model.__name__,
+            *(join.model.__name__ for join in self._get_joins(join)),
+            *(where.get_subquery_tables() if where is not None else ()),
+        )
+
+    def _after_write(
+        self, model: ty.Type[Models], objs: ty.Iterable[Models] | None = None
+    ) -> None:
+        """
+        Invalidates caches after writing to model table.
+        :param model: changed model.
+        :param objs: changed objects. None - any row could be changed.
+        """
+        self._writes[self.db_name] = self._writes.get(self.db_name, 0) + 1
+        if (router := self.routers.get(self.db_name)) is not None:
+            router.mark_write()
+        if (query_cache := self.query_caches.get(self.db_name)) is not None:
+            query_cache.invalidate_table(model.__name__)
+        if (cache := self._get_object_cache(model.__name__)) is None:
+            return
+        if objs is None:
+            cache.clear()
+            return
+        for obj in objs:
+            cache.invalidate(obj.id)
+
     @ty.overload
     def _assign_ids(self, objs: Models, obj_ids: list[int]) -> Models: ...
     @ty.overload
@@ -360,6 +1195,8 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
             objs = [objs]
         for obj, obj_id in zip(objs, obj_ids):
             obj.id = obj_id
+            if self._session is not None:
+                self._session.identity_map.add(self.db_name, obj)
         return objs if return_list else objs[0]
 
     @ty.overload
@@ -391,6 +1228,13 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         join: Join[JoinModel],
     ) -> tuple[Model | None, JoinModel | None]: ...
     @ty.overload
+    def _convert_data[Model](
+        self,
+        model: ty.Type[Model],
+        data: tuple[ty.Any, ...],
+        join: tuple[Join, ...],
+    ) -> tuple[Model | None, ...]: ...
+    @ty.overload
     def _convert_data[Model](
         self, model: ty.Type[Model], data: tuple[ty.Any, ...], join: None = None
     ) -> Model: ...
@@ -398,18 +1242,21 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
         self,
         model: ty.Type[Model],
         data: tuple[ty.Any, ...],
-        join: Join[JoinModel] | None = None,
-    ) -> tuple[Model | None, JoinModel | None] | Model | None:
+        join: Join[JoinModel] | tuple[Join, ...] | None = None,
+    ) -> tuple[ty.Any, ...] | Model | None:
         """
         Converts raw data from db to model.
+        Row of joined models is split by field count of each model.
         """
         signature = self.signatures[model.__name__]
         if join:
-            sep = len(signature.fields)
-            return (
-                self._convert_data(model, data[:sep]),
-                self._convert_data(join.model, data[sep:]),
-            )
+            objs = []
+            start = 0
+            for obj_model in (model, *(x.model for x in self._get_joins(join))):
+                end = start + len(self.signatures[obj_model.__name__].fields)
+                objs.append(self._convert_data(obj_model, data[start:end]))
+                start = end
+            return tuple(objs)
         elif set(data) == {None}:
             return None
 
@@ -419,10 +1266,54 @@ class BaseDBCore[ProviderT: BaseProvider, Models](ABC):
                 f"but {len(data)} given"
             )
 
-        kwargs: dict[str, ty.Any] = {}
+        provider = self.provider
+        if self._session is not None:
+            for field, value in zip(signature.fields, data):
+                if field.name == "id":
+                    obj_id = provider.get_decoder(field)(value)
+                    if (
+                        obj := self._session.identity_map.get(
+                            self.db_name, signature.name, obj_id
+                        )
+                    ) is not None:
+                        return obj
+                    break
+
+        values: list[ty.Any] = []
         for field, value in zip(signature.fields, data):
-            kwargs[field.name] = self.provider.convert_value(
-                value, field.python_type
+            decoder = provider.get_decoder(field)
+            values.append(
+                LazyValue(value, decoder)
+                if field.lazy and value is not None
+                else decoder(value)
+            )
+
+        if signature.positional_init:
+            obj = model(*values)
+        else:
+            obj = model(
+                **{
+                    field.name: value
+                    for field, value in zip(signature.fields, values)
+                }
             )
+        if self._session is not None:
+            self._session.identity_map.add(self.db_name, obj)
+        return obj
+
+
+class _Descending:
+    """
+    Inverts comparison of sort key item.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: ty.Any):
+        self.value = value
+
+    def __eq__(self, other: ty.Any) -> bool:
+        return self.value == other.value
 
-        return model(**kwargs)
+    def __lt__(self, other: ty.Any) -> bool:
+        return other.value < self.value
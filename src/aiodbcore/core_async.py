@@ -1,5 +1,11 @@
+import asyncio
+import typing as ty
+import weakref
+
 from .core import BaseDBCore
+from .loader import BatchLoader
 from .providers import BaseAsyncProvider
+from .writer import BufferedWriter
 
 
 class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
@@ -11,11 +17,55 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
 
     _use_async = True
 
+    loaders: dict[tuple[str, str], BatchLoader] = {}
+    # {(db_name, model_name): loader}
+
+    coalesce_reads: bool = False
+    """ concurrent identical reads share one provider call """
+    _in_flight: dict[tuple, asyncio.Future] = {}
+
+    _loop_providers: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, BaseAsyncProvider]
+    ] = weakref.WeakKeyDictionary()
+
+    writers: weakref.WeakSet[BufferedWriter] = weakref.WeakSet()
+
     @classmethod
     async def close_connections(cls) -> None:
-        for provider in cls.dbs.values():
-            if isinstance(provider, BaseAsyncProvider):
-                await provider.close_connection()
+        """
+        Closes all connections of current event loop
+        and connections left by closed event loops.
+        Buffered writers of current event loop are flushed before it.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            for writer in list(cls.writers):
+                if writer.loop is loop:
+                    cls.writers.discard(writer)
+                    await writer.close()
+        finally:
+            if cls.scoped_providers:
+                providers = list(cls._loop_providers.pop(loop, {}).values())
+                for other_loop in list(cls._loop_providers):
+                    if other_loop.is_closed():
+                        providers.extend(
+                            cls._loop_providers.pop(other_loop).values()
+                        )
+            else:
+                providers = list(cls.dbs.values())
+            for provider in providers:
+                if isinstance(provider, BaseAsyncProvider):
+                    await provider.close_connection()
+
+    @classmethod
+    def _get_scoped_providers(cls) -> dict[str, BaseAsyncProvider] | None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        if (providers := cls._loop_providers.get(loop)) is None:
+            providers = cls._loop_providers[loop] = {}
+        return providers
 
     async def execute(self, query, args=()):
         return await self.provider.execute(query, args)
@@ -27,10 +77,77 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
             )
 
     async def insert(self, objs, /) -> Models | list[Models]:
+        if (
+            groups := self._split_by_shard(
+                objs if isinstance(objs, list) else [objs]
+            )
+        ) is not None:
+            for db_name, group in groups.items():
+                await self._using(db_name).insert(group)
+            return objs
         obj_ids = await self.provider.execute_insert_query(
             *self._prepare_insert_query(objs)
         )
-        return self._assign_ids(objs, obj_ids)
+        objs = self._assign_ids(objs, obj_ids)
+        inserted = objs if isinstance(objs, list) else [objs]
+        self._after_write(inserted[0].__class__, inserted)
+        return objs
+
+    async def get(self, model, obj_id, /):
+        if (
+            dbs := self._get_shard_dbs(model.__name__, model.id == obj_id)
+        ) is not None:
+            if len(dbs) != 1:
+                objs = await self.fetchall(
+                    model, where=model.id == obj_id, limit=2
+                )
+                return self._get_unique_shard_object(model, obj_id, objs)
+            return await dbs[0].get(model, obj_id)
+        if (obj := self._get_cached(model, obj_id)) is not None:
+            return obj
+        generation = self._get_cache_generation(model)
+        if data := await self._coalesce(
+            self._read_one,
+            *self._prepare_select_query(
+                model.__name__, where=model.id == obj_id
+            ),
+        ):
+            self._cache_row(model, obj_id, data, generation)
+            return self._convert_data(model, data)
+
+    async def load(self, model, obj_id, /):
+        """
+        Fetches one row by primary key.
+        Lookups made by concurrent coroutines within one event loop tick
+        are fetched by one `id IN (...)` query.
+        :param model: model to fetch.
+        :param obj_id: id of row.
+        :returns: one model or None.
+        """
+        if (
+            dbs := self._get_shard_dbs(model.__name__, model.id == obj_id)
+        ) is not None:
+            if len(dbs) != 1:
+                objs = await self.fetchall(
+                    model, where=model.id == obj_id, limit=2
+                )
+                return self._get_unique_shard_object(model, obj_id, objs)
+            return await dbs[0].load(model, obj_id)
+        if (obj := self._get_cached(model, obj_id)) is not None:
+            return obj
+        generation = self._get_cache_generation(model)
+        if data := await self._get_loader(model).load(obj_id):
+            self._cache_row(model, obj_id, data, generation)
+            return self._convert_data(model, data)
+
+    def _get_loader(self, model) -> BatchLoader:
+        key = (self.db_name, model.__name__)
+        loader = self.loaders.get(key)
+        if loader is None or loader.loop is not asyncio.get_running_loop():
+            loader = self.loaders[key] = BatchLoader(
+                self, model, self.IN_CHUNK_SIZE
+            )
+        return loader
 
     async def fetchone(
         self,
@@ -42,10 +159,25 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         limit=None,
         offset=0,
     ):
-        if data := await self.provider.fetchone(
+        if (dbs := self._get_shard_dbs(model.__name__, where)) is not None:
+            if len(dbs) != 1:
+                objs = await self._scatter(
+                    dbs, model, join, where, order_by, 1, offset
+                )
+                return objs[0] if objs else None
+            return await dbs[0].fetchone(
+                model,
+                join=join,
+                where=where,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            )
+        if data := await self._coalesce(
+            self._read_one,
             *self._prepare_select_query(
                 model.__name__, None, join, where, order_by, limit, offset
-            )
+            ),
         ):
             return self._convert_data(model, data, join)
 
@@ -58,27 +190,266 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         order_by=None,
         limit=None,
         offset=0,
+        prefetch=None,
     ):
-        data = await self.provider.fetchall(
-            *self._prepare_select_query(
-                model.__name__, None, join, where, order_by, limit, offset
+        if (dbs := self._get_shard_dbs(model.__name__, where)) is not None:
+            if len(dbs) == 1:
+                return await dbs[0].fetchall(
+                    model,
+                    join=join,
+                    where=where,
+                    order_by=order_by,
+                    limit=limit,
+                    offset=offset,
+                    prefetch=prefetch,
+                )
+            objs = await self._scatter(
+                dbs, model, join, where, order_by, limit, offset
+            )
+        else:
+            data = await self._fetchall_rows(
+                self._get_query_tables(model, join, where),
+                *self._prepare_select_query(
+                    model.__name__, None, join, where, order_by, limit, offset
+                ),
+            )
+            objs = (
+                [self._convert_data(model, obj, join) for obj in data]
+                if data
+                else []
+            )
+        if prefetch is not None and objs:
+            await self._prefetch(
+                objs, prefetch if isinstance(prefetch, tuple) else (prefetch,)
+            )
+        return objs
+
+    async def _prefetch(self, objs, prefetches) -> None:
+        """
+        Loads relations of fetched objects.
+        """
+        for prefetch in prefetches:
+            parents = self._get_prefetch_parents(prefetch, objs)
+            related = []
+            for query in self._prepare_prefetch_queries(prefetch, parents):
+                related.extend(
+                    self._convert_data(prefetch.model, row)
+                    for row in await self._fetchall_rows(
+                        (prefetch.model.__name__,), *query
+                    )
+                )
+            self._attach_prefetched(prefetch, parents, related)
+
+    async def _fetchall_rows(
+        self,
+        tables: tuple[str, ...],
+        query: str,
+        args: ty.Sequence[ty.Any] = (),
+    ) -> list[tuple[ty.Any, ...]]:
+        """
+        Fetches raw rows using query cache if it is enabled.
+        """
+        if (cache := self.query_caches.get(self.db_name)) is None or (
+            key := self._query_cache_key(query, args)
+        ) is None:
+            return await self._coalesce(self._read_all, query, args)
+        if (data := cache.get(key)) is None:
+            data = await self._coalesce(
+                self._read_all_cached, query, args, tables, key
             )
+        return data
+
+    async def _read_all_cached(
+        self,
+        query: str,
+        args: ty.Sequence[ty.Any],
+        tables: tuple[str, ...],
+        key: ty.Hashable,
+    ) -> list[tuple[ty.Any, ...]]:
+        """
+        Fetches raw rows and puts them to query cache.
+        """
+        cache = self.query_caches[self.db_name]
+        generation = cache.generation
+        data = await self._read_all(query, args)
+        cache.set(key, data, tables, generation)
+        return data
+
+    async def _coalesce[T](
+        self,
+        fetch: ty.Callable[..., ty.Awaitable[T]],
+        query: str,
+        args: ty.Sequence[ty.Any] = (),
+        *fetch_args: ty.Any,
+    ) -> T:
+        """
+        Executes read query.
+        If `coalesce_reads` is enabled, identical queries that are executed
+        concurrently share one provider call.
+        Reads issued after a write don't share call started before it.
+        :param fetch: called as `fetch(query, args, *fetch_args)`.
+        """
+        if (
+            not self.coalesce_reads
+            or (key := self._query_cache_key(query, args)) is None
+        ):
+            return await fetch(query, args, *fetch_args)
+        key = (
+            asyncio.get_running_loop(),
+            self.db_name,
+            self._writes.get(self.db_name, 0),
+            fetch.__name__,
+            key,
         )
-        return (
-            [self._convert_data(model, obj, join) for obj in data]
-            if data
-            else []
+        if (future := self._in_flight.get(key)) is None:
+            future = asyncio.ensure_future(fetch(query, args, *fetch_args))
+            self._in_flight[key] = future
+
+            def _done(f: asyncio.Future) -> None:
+                if self._in_flight.get(key) is f:
+                    del self._in_flight[key]
+                if not f.cancelled():
+                    # all waiters may be cancelled, error is retrieved here
+                    # so it is not logged as never retrieved
+                    f.exception()
+
+            future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    async def _read_one(
+        self, query: str, args: ty.Sequence[ty.Any] = ()
+    ) -> tuple[ty.Any, ...] | None:
+        return await self._read("fetchone", query, args)
+
+    async def _read_all(
+        self, query: str, args: ty.Sequence[ty.Any] = ()
+    ) -> list[tuple[ty.Any, ...]]:
+        return await self._read("fetchall", query, args)
+
+    async def _read(
+        self, method: str, query: str, args: ty.Sequence[ty.Any]
+    ) -> ty.Any:
+        """
+        Executes read query by replica if replicas are enabled.
+        """
+        if (router := self.routers.get(self.db_name)) is None or (
+            replica := router.acquire()
+        ) is None:
+            return await getattr(self.provider, method)(query, args)
+        try:
+            provider = self._get_provider(replica)
+            return await getattr(provider, method)(query, args)
+        finally:
+            router.release(replica)
+
+    async def count(self, model, *, where=None) -> int:
+        return sum(await self._aggregate(model.__name__, "COUNT(*)", where))
+
+    async def sum(self, field, *, where=None):
+        values = [
+            value
+            for value in await self._aggregate(
+                field.model_name, f"SUM({field})", where
+            )
+            if value is not None
+        ]
+        return sum(values) if values else None
+
+    async def _scatter(
+        self, dbs, model, join, where, order_by, limit, offset
+    ) -> list[ty.Any]:
+        """
+        Fetches rows from several shards concurrently and merges them.
+        """
+        results = await self._gather(
+            [
+                db._fetchall_rows(
+                    *db._prepare_shard_select_query(
+                        model, join, where, order_by, limit, offset
+                    )
+                )
+                for db in dbs
+            ]
+        )
+        return [
+            db._convert_data(model, row, join)
+            for db, row in self._merge_shard_rows(
+                model.__name__,
+                join,
+                order_by,
+                limit,
+                offset,
+                list(zip(dbs, results)),
+            )
+        ]
+
+    async def _aggregate(
+        self, model_name: str, expression: str, where
+    ) -> list[ty.Any]:
+        """
+        :returns: result of aggregate function from each shard.
+        """
+        if (dbs := self._get_shard_dbs(model_name, where)) is None:
+            dbs = [self]
+        results = await self._gather(
+            [
+                db._fetchall_rows(
+                    *db._prepare_aggregate_query(model_name, expression, where)
+                )
+                for db in dbs
+            ]
         )
+        return [rows[0][0] for rows in results]
+
+    @staticmethod
+    async def _gather[T](aws: list[ty.Awaitable[T]]) -> list[T]:
+        if len(aws) == 1:
+            return [await aws[0]]
+        return await asyncio.gather(*aws)
 
     async def save(self, obj) -> None:
+        db = self._get_object_shard_db(obj)
+        if self._session is not None:
+            return self._session.add(obj, (db or self).db_name)
+        if db is not None:
+            return await db.save(obj)
         if (query := self._prepare_save_query(obj)) is not None:
-            return await self.execute(*query)
+            await self.execute(*query)
+            self._after_write(obj.__class__, [obj])
+
+    async def flush(self) -> None:
+        if self._session is None:
+            return
+        objs = self._session.pop_pending()
+        try:
+            for db, group, queries in self._prepare_flush_batches(objs):
+                if queries:
+                    await db.provider.execute_batch(queries)
+                flushed = set(map(id, group))
+                objs = [obj for obj in objs if id(obj) not in flushed]
+                for obj in group:
+                    db._after_write(obj.__class__, [obj])
+        except BaseException:
+            self._session.restore_pending(objs)
+            raise
 
     async def update(self, model, fields, *, where=None) -> None:
-        await self.execute(*self._prepare_update_query(model, fields, where))
+        if self._session is not None:
+            await self.flush()
+            self._session.identity_map.clear(model.__name__)
+        dbs = self._get_shard_dbs(model.__name__, where)
+        for db in dbs if dbs is not None else (self,):
+            await db.execute(*db._prepare_update_query(model, fields, where))
+            db._after_write(model)
 
     async def delete(self, model, *, where) -> None:
-        await self.execute(*self._prepare_delete_query(model, where))
+        if self._session is not None:
+            await self.flush()
+            self._session.identity_map.clear(model.__name__)
+        dbs = self._get_shard_dbs(model.__name__, where)
+        for db in dbs if dbs is not None else (self,):
+            await db.execute(*db._prepare_delete_query(model, where))
+            db._after_write(model)
 
     async def drop_table(self, model, /) -> None:
         """
@@ -86,3 +457,24 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         :param model: model to drop.
         """
         await self.execute(self._prepare_drop_table_query(model))
+        for query in self._prepare_drop_full_text_queries(model):
+            await self.execute(query)
+        self._after_write(model)
+
+    def buffered_writer[Model](
+        self,
+        model: ty.Type[Model],
+        max_rows: int = 1000,
+        max_delay: float = 1.0,
+    ) -> BufferedWriter[Model]:
+        """
+        Creates write-behind insert queue of current event loop.
+        Objects are inserted in background by chunked multi-row inserts
+        (`COPY` on PostgreSQL), it is flushed by `close_connections`.
+        :param model: model of objects.
+        :param max_rows: size of buffer, `put` waits when it is full.
+        :param max_delay: max time in seconds object stays in buffer.
+        """
+        writer = BufferedWriter(self, model, max_rows, max_delay)
+        self.writers.add(writer)
+        return writer
@@ -4,10 +4,11 @@ import typing as ty
 
 if ty.TYPE_CHECKING:
     from .core import BaseDBCore
-    from .joins import InnerJoin, LeftJoin, RightJoin
+    from .joins import InnerJoin, Join, LeftJoin, Prefetch, RightJoin
     from .models import Field
-    from .operators import InvertedField, Operator
+    from .operators import FullTextRank, InvertedField, Operator
     from .providers import BaseAsyncProvider
+    from .writer import BufferedWriter
 
 
 class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
@@ -19,6 +20,12 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
     async def insert[Model](self, objs: list[Model], /) -> list[Model]: ...
     @ty.overload
     async def insert[Model](self, obj: Model, /) -> Model: ...
+    async def get[Model](
+        self, model: ty.Type[Model], obj_id: int, /
+    ) -> Model | None: ...
+    async def load[Model](
+        self, model: ty.Type[Model], obj_id: int, /
+    ) -> Model | None: ...
     @ty.overload
     async def fetchone[Model](
         self,
@@ -27,7 +34,11 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -40,7 +51,11 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: InnerJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -53,7 +68,11 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: LeftJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -66,12 +85,33 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: RightJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
     ) -> tuple[Model | None, JoinModel] | None: ...
     @ty.overload
+    async def fetchone[Model](
+        self,
+        model: ty.Type[Model],
+        *,
+        join: tuple[Join, ...],
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[ty.Any, ...] | None: ...
+    @ty.overload
     async def fetchall[Model](
         self,
         model: ty.Type[Model],
@@ -79,10 +119,15 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[Model]: ...
     @ty.overload
     async def fetchall[Model, JoinModel](
@@ -92,10 +137,15 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: InnerJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model, JoinModel]]: ...
     @ty.overload
     async def fetchall[Model, JoinModel](
@@ -105,10 +155,15 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: LeftJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model, JoinModel | None]]: ...
     @ty.overload
     async def fetchall[Model, JoinModel](
@@ -118,12 +173,48 @@ class AsyncDBCore[Models](BaseDBCore[BaseAsyncProvider, Models]):
         join: RightJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model | None, JoinModel]]: ...
+    @ty.overload
+    async def fetchall[Model](
+        self,
+        model: ty.Type[Model],
+        *,
+        join: tuple[Join, ...],
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
+    ) -> list[tuple[ty.Any, ...]]: ...
+    async def count(
+        self, model: ty.Type[Models], *, where: Operator | None = None
+    ) -> int: ...
+    async def sum[T](
+        self, field: Field[T], *, where: Operator | None = None
+    ) -> T | None: ...
     async def save(self, obj) -> None: ...
+    async def flush(self) -> None: ...
     async def update(self, model, fields, *, where=None) -> None: ...
     async def delete(self, model, *, where) -> None: ...
     async def drop_table(self, model, /) -> None: ...
+    def buffered_writer[Model](
+        self,
+        model: ty.Type[Model],
+        max_rows: int = 1000,
+        max_delay: float = 1.0,
+    ) -> BufferedWriter[Model]: ...
@@ -1,3 +1,6 @@
+import threading
+import typing as ty
+
 from .core import BaseDBCore
 from .providers import BaseSyncProvider
 
@@ -11,12 +14,30 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
 
     _use_async = False
 
+    _thread_providers = threading.local()
+
     @classmethod
     def close_connections(cls) -> None:
-        for provider in cls.dbs.values():
+        """
+        Closes all connections of current thread.
+        """
+        if cls.scoped_providers:
+            providers = list(cls._get_scoped_providers().values())
+            cls._get_scoped_providers().clear()
+        else:
+            providers = list(cls.dbs.values())
+        for provider in providers:
             if isinstance(provider, BaseSyncProvider):
                 provider.close_connection()
 
+    @classmethod
+    def _get_scoped_providers(cls) -> dict[str, BaseSyncProvider]:
+        try:
+            return cls._thread_providers.providers
+        except AttributeError:
+            providers = cls._thread_providers.providers = {}
+            return providers
+
     def execute(self, query, args=()):
         return self.provider.execute(query, args)
 
@@ -27,10 +48,42 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
             )
 
     def insert(self, objs, /) -> Models | list[Models]:
+        if (
+            groups := self._split_by_shard(
+                objs if isinstance(objs, list) else [objs]
+            )
+        ) is not None:
+            for db_name, group in groups.items():
+                self._using(db_name).insert(group)
+            return objs
         obj_ids = self.provider.execute_insert_query(
             *self._prepare_insert_query(objs)
         )
-        return self._assign_ids(objs, obj_ids)
+        objs = self._assign_ids(objs, obj_ids)
+        inserted = objs if isinstance(objs, list) else [objs]
+        self._after_write(inserted[0].__class__, inserted)
+        return objs
+
+    def get(self, model, obj_id, /):
+        if (
+            dbs := self._get_shard_dbs(model.__name__, model.id == obj_id)
+        ) is not None:
+            if len(dbs) != 1:
+                objs = self.fetchall(
+                    model, where=model.id == obj_id, limit=2
+                )
+                return self._get_unique_shard_object(model, obj_id, objs)
+            return dbs[0].get(model, obj_id)
+        if (obj := self._get_cached(model, obj_id)) is not None:
+            return obj
+        generation = self._get_cache_generation(model)
+        if data := self._read_one(
+            *self._prepare_select_query(
+                model.__name__, where=model.id == obj_id
+            )
+        ):
+            self._cache_row(model, obj_id, data, generation)
+            return self._convert_data(model, data)
 
     def fetchone(
         self,
@@ -42,7 +95,21 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         limit=None,
         offset=0,
     ):
-        if data := self.provider.fetchone(
+        if (dbs := self._get_shard_dbs(model.__name__, where)) is not None:
+            if len(dbs) != 1:
+                objs = self._scatter(
+                    dbs, model, join, where, order_by, 1, offset
+                )
+                return objs[0] if objs else None
+            return dbs[0].fetchone(
+                model,
+                join=join,
+                where=where,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            )
+        if data := self._read_one(
             *self._prepare_select_query(
                 model.__name__, None, join, where, order_by, limit, offset
             )
@@ -58,27 +125,199 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         order_by=None,
         limit=None,
         offset=0,
+        prefetch=None,
     ):
-        data = self.provider.fetchall(
-            *self._prepare_select_query(
-                model.__name__, None, join, where, order_by, limit, offset
+        if (dbs := self._get_shard_dbs(model.__name__, where)) is not None:
+            if len(dbs) == 1:
+                return dbs[0].fetchall(
+                    model,
+                    join=join,
+                    where=where,
+                    order_by=order_by,
+                    limit=limit,
+                    offset=offset,
+                    prefetch=prefetch,
+                )
+            objs = self._scatter(
+                dbs, model, join, where, order_by, limit, offset
             )
-        )
-        return (
-            [self._convert_data(model, obj, join) for obj in data]
-            if data
-            else []
-        )
+        else:
+            data = self._fetchall_rows(
+                self._get_query_tables(model, join, where),
+                *self._prepare_select_query(
+                    model.__name__, None, join, where, order_by, limit, offset
+                ),
+            )
+            objs = (
+                [self._convert_data(model, obj, join) for obj in data]
+                if data
+                else []
+            )
+        if prefetch is not None and objs:
+            self._prefetch(
+                objs, prefetch if isinstance(prefetch, tuple) else (prefetch,)
+            )
+        return objs
+
+    def _prefetch(self, objs, prefetches) -> None:
+        """
+        Loads relations of fetched objects.
+        """
+        for prefetch in prefetches:
+            parents = self._get_prefetch_parents(prefetch, objs)
+            related = []
+            for query in self._prepare_prefetch_queries(prefetch, parents):
+                related.extend(
+                    self._convert_data(prefetch.model, row)
+                    for row in self._fetchall_rows(
+                        (prefetch.model.__name__,), *query
+                    )
+                )
+            self._attach_prefetched(prefetch, parents, related)
+
+    def _fetchall_rows(
+        self,
+        tables: tuple[str, ...],
+        query: str,
+        args: ty.Sequence[ty.Any] = (),
+    ) -> list[tuple[ty.Any, ...]]:
+        """
+        Fetches raw rows using query cache if it is enabled.
+        """
+        if (cache := self.query_caches.get(self.db_name)) is None or (
+            key := self._query_cache_key(query, args)
+        ) is None:
+            return self._read_all(query, args)
+        if (data := cache.get(key)) is None:
+            generation = cache.generation
+            data = self._read_all(query, args)
+            cache.set(key, data, tables, generation)
+        return data
+
+    def _read_one(
+        self, query: str, args: ty.Sequence[ty.Any] = ()
+    ) -> tuple[ty.Any, ...] | None:
+        return self._read("fetchone", query, args)
+
+    def _read_all(
+        self, query: str, args: ty.Sequence[ty.Any] = ()
+    ) -> list[tuple[ty.Any, ...]]:
+        return self._read("fetchall", query, args)
+
+    def _read(
+        self, method: str, query: str, args: ty.Sequence[ty.Any]
+    ) -> ty.Any:
+        """
+        Executes read query by replica if replicas are enabled.
+        """
+        if (router := self.routers.get(self.db_name)) is None or (
+            replica := router.acquire()
+        ) is None:
+            return getattr(self.provider, method)(query, args)
+        try:
+            provider = self._get_provider(replica)
+            return getattr(provider, method)(query, args)
+        finally:
+            router.release(replica)
+
+    def count(self, model, *, where=None) -> int:
+        return sum(self._aggregate(model.__name__, "COUNT(*)", where))
+
+    def sum(self, field, *, where=None):
+        values = [
+            value
+            for value in self._aggregate(
+                field.model_name, f"SUM({field})", where
+            )
+            if value is not None
+        ]
+        return sum(values) if values else None
+
+    def _scatter(
+        self, dbs, model, join, where, order_by, limit, offset
+    ) -> list[ty.Any]:
+        """
+        Fetches rows from several shards and merges them.
+        """
+        results = [
+            db._fetchall_rows(
+                *db._prepare_shard_select_query(
+                    model, join, where, order_by, limit, offset
+                )
+            )
+            for db in dbs
+        ]
+        return [
+            db._convert_data(model, row, join)
+            for db, row in self._merge_shard_rows(
+                model.__name__,
+                join,
+                order_by,
+                limit,
+                offset,
+                list(zip(dbs, results)),
+            )
+        ]
+
+    def _aggregate(
+        self, model_name: str, expression: str, where
+    ) -> list[ty.Any]:
+        """
+        :returns: result of aggregate function from each shard.
+        """
+        if (dbs := self._get_shard_dbs(model_name, where)) is None:
+            dbs = [self]
+        results = [
+            db._fetchall_rows(
+                *db._prepare_aggregate_query(model_name, expression, where)
+            )
+            for db in dbs
+        ]
+        return [rows[0][0] for rows in results]
 
     def save(self, obj) -> None:
+        db = self._get_object_shard_db(obj)
+        if self._session is not None:
+            return self._session.add(obj, (db or self).db_name)
+        if db is not None:
+            return db.save(obj)
         if (query := self._prepare_save_query(obj)) is not None:
-            return self.execute(*query)
+            self.execute(*query)
+            self._after_write(obj.__class__, [obj])
+
+    def flush(self) -> None:
+        if self._session is None:
+            return
+        objs = self._session.pop_pending()
+        try:
+            for db, group, queries in self._prepare_flush_batches(objs):
+                if queries:
+                    db.provider.execute_batch(queries)
+                flushed = set(map(id, group))
+                objs = [obj for obj in objs if id(obj) not in flushed]
+                for obj in group:
+                    db._after_write(obj.__class__, [obj])
+        except BaseException:
+            self._session.restore_pending(objs)
+            raise
 
     def update(self, model, fields, *, where=None) -> None:
-        self.execute(*self._prepare_update_query(model, fields, where))
+        if self._session is not None:
+            self.flush()
+            self._session.identity_map.clear(model.__name__)
+        dbs = self._get_shard_dbs(model.__name__, where)
+        for db in dbs if dbs is not None else (self,):
+            db.execute(*db._prepare_update_query(model, fields, where))
+            db._after_write(model)
 
     def delete(self, model, *, where) -> None:
-        self.execute(*self._prepare_delete_query(model, where))
+        if self._session is not None:
+            self.flush()
+            self._session.identity_map.clear(model.__name__)
+        dbs = self._get_shard_dbs(model.__name__, where)
+        for db in dbs if dbs is not None else (self,):
+            db.execute(*db._prepare_delete_query(model, where))
+            db._after_write(model)
 
     def drop_table(self, model, /) -> None:
         """
@@ -86,3 +325,6 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         :param model: model to drop.
         """
         self.execute(self._prepare_drop_table_query(model))
+        for query in self._prepare_drop_full_text_queries(model):
+            self.execute(query)
+        self._after_write(model)
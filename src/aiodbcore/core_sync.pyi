@@ -4,9 +4,9 @@ import typing as ty
 
 if ty.TYPE_CHECKING:
     from .core import BaseDBCore
-    from .joins import InnerJoin, LeftJoin, RightJoin
+    from .joins import InnerJoin, Join, LeftJoin, Prefetch, RightJoin
     from .models import Field
-    from .operators import InvertedField, Operator
+    from .operators import FullTextRank, InvertedField, Operator
     from .providers import BaseSyncProvider
 
 
@@ -19,6 +19,9 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
     def insert[Model](self, objs: list[Model], /) -> list[Model]: ...
     @ty.overload
     def insert[Model](self, obj: Model, /) -> Model: ...
+    def get[Model](
+        self, model: ty.Type[Model], obj_id: int, /
+    ) -> Model | None: ...
     @ty.overload
     def fetchone[Model](
         self,
@@ -27,7 +30,11 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -40,7 +47,11 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: InnerJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -53,7 +64,11 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: LeftJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
@@ -66,12 +81,33 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: RightJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
     ) -> tuple[Model | None, JoinModel] | None: ...
     @ty.overload
+    def fetchone[Model](
+        self,
+        model: ty.Type[Model],
+        *,
+        join: tuple[Join, ...],
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[ty.Any, ...] | None: ...
+    @ty.overload
     def fetchall[Model](
         self,
         model: ty.Type[Model],
@@ -79,10 +115,15 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: None = None,
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[Model]: ...
     @ty.overload
     def fetchall[Model, JoinModel](
@@ -92,10 +133,15 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: InnerJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model, JoinModel]]: ...
     @ty.overload
     def fetchall[Model, JoinModel](
@@ -105,10 +151,15 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: LeftJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model, JoinModel | None]]: ...
     @ty.overload
     def fetchall[Model, JoinModel](
@@ -118,12 +169,42 @@ class SyncDBCore[Models](BaseDBCore[BaseSyncProvider, Models]):
         join: RightJoin[JoinModel],
         where: Operator | None = None,
         order_by: (
-            Field | InvertedField | tuple[Field | InvertedField, ...] | None
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
         ) = None,
         limit: int | None = None,
         offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
     ) -> list[tuple[Model | None, JoinModel]]: ...
+    @ty.overload
+    def fetchall[Model](
+        self,
+        model: ty.Type[Model],
+        *,
+        join: tuple[Join, ...],
+        where: Operator | None = None,
+        order_by: (
+            Field
+            | InvertedField
+            | FullTextRank
+            | tuple[Field | InvertedField | FullTextRank, ...]
+            | None
+        ) = None,
+        limit: int | None = None,
+        offset: int = 0,
+        prefetch: Prefetch | tuple[Prefetch, ...] | None = None,
+    ) -> list[tuple[ty.Any, ...]]: ...
+    def count(
+        self, model: ty.Type[Models], *, where: Operator | None = None
+    ) -> int: ...
+    def sum[T](
+        self, field: Field[T], *, where: Operator | None = None
+    ) -> T | None: ...
     def save(self, obj) -> None: ...
+    def flush(self) -> None: ...
     def update(self, model, fields, *, where=None) -> None: ...
     def delete(self, model, *, where) -> None: ...
     def drop_table(self, model, /) -> None: ...
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import typing as ty
 from abc import ABC
 
@@ -14,15 +15,45 @@ class Join[T](ABC):
         self,
         model: ty.Type[T],
         on: tuple[Field, Field],
+        alias: str | None = None,
     ):
+        """
+        :param model: model to join.
+        :param on: pair of fields to join on.
+        :param alias: name of joined table in the query.
+            Required to join the same model several times.
+            The field of joined model in `on` refers to the alias
+            (the second one if both fields belong to the model).
+        """
         self.model = model
+        self.alias = alias
+        if alias is not None:
+            if on[1].model_name == model.__name__:
+                on = (on[0], self[on[1]])
+            elif on[0].model_name == model.__name__:
+                on = (self[on[0]], on[1])
         self.on: tuple[Field, Field] = on
 
+    @property
+    def table_name(self) -> str:
+        return self.alias or self.model.__name__
+
+    def __getitem__[FT](self, field: Field[FT]) -> Field[FT]:
+        """
+        :returns: field of the joined table.
+            Use it to refer to aliased table in `where` and `order_by`.
+        """
+        if self.alias is None:
+            return field
+        aliased_field = copy.copy(field)
+        aliased_field.model_name = self.alias
+        return aliased_field
+
     def __repr__(self):
+        alias = f' AS "{self.alias}"' if self.alias is not None else ""
         return (
-            f'{self.type} JOIN "{self.model.__name__.lower()}" ON '
-            f"{self.on[0].model_name.lower()}.{self.on[0].name.lower()}="
-            f"{self.on[1].model_name.lower()}.{self.on[1].name.lower()}"
+            f'{self.type} JOIN "{self.model.__name__}"{alias} ON '
+            f"{self.on[0]}={self.on[1]}"
         )
 
     __str__ = __repr__
@@ -38,3 +69,46 @@ class RightJoin[T](Join[T]):
 
 class LeftJoin[T](Join[T]):
     type = "LEFT"
+
+
+class Prefetch[T]:
+    """
+    Relation loaded by a separate `WHERE field IN (...)` query.
+    Loaded objects are set to the attribute of parent objects.
+
+    >>> orders = await db.fetchall(
+    ...     Order,
+    ...     prefetch=(
+    ...         Prefetch(Item, (Order.id, Item.order_id), to="items"),
+    ...         Prefetch(
+    ...             Customer,
+    ...             (Order.customer_id, Customer.id),
+    ...             to="customer",
+    ...             many=False,
+    ...         ),
+    ...     ),
+    ... )
+    """
+
+    def __init__(
+        self,
+        model: ty.Type[T],
+        on: tuple[Field, Field],
+        to: str,
+        many: bool = True,
+    ):
+        """
+        :param model: model to load.
+        :param on: parent field and field of loaded model.
+        :param to: name of parent attribute.
+        :param many: set list of objects if True, one object or None otherwise.
+        """
+        self.model = model
+        if on[0].model_name == model.__name__:
+            on = (on[1], on[0])
+        if on[1].model_name != model.__name__:
+            raise ValueError(f"{on} does not contain field of {model.__name__}")
+        self.parent_field: Field = on[0]
+        self.field: Field = on[1]
+        self.to = to
+        self.many = many
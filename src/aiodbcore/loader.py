@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from .core_async import AsyncDBCore
+
+
+class BatchLoader[Model]:
+    """
+    Collects lookups by id made within one event loop tick
+    and fetches them by one `id IN (...)` query per chunk.
+    """
+
+    def __init__(
+        self, db: AsyncDBCore, model: ty.Type[Model], chunk_size: int = 500
+    ):
+        """
+        :param db: db used to execute queries.
+        :param model: model to fetch.
+        :param chunk_size: max count of ids in one query.
+        """
+        self.db = db
+        self.model = model
+        self.chunk_size = chunk_size
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[int, list[asyncio.Future]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, obj_id: int) -> asyncio.Future[tuple[ty.Any, ...] | None]:
+        """
+        Schedules lookup of row.
+        :param obj_id: id of row.
+        :returns: future with raw row or None.
+        """
+        if not self._pending:
+            self.loop.call_soon(self._schedule)
+        future = self.loop.create_future()
+        self._pending.setdefault(obj_id, []).append(future)
+        return future
+
+    def _schedule(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = self.loop.create_task(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: dict[int, list[asyncio.Future]]) -> None:
+        signature = self.db.signatures[self.model.__name__]
+        id_index = next(
+            i for i, field in enumerate(signature.fields) if field.name == "id"
+        )
+        obj_ids = list(pending)
+        for i in range(0, len(obj_ids), self.chunk_size):
+            chunk = obj_ids[i : i + self.chunk_size]
+            try:
+                rows = await self.db._read_all(
+                    *self.db._prepare_select_query(
+                        self.model.__name__,
+                        where=self.model.id.contained(chunk),
+                    )
+                )
+            except Exception as exc:
+                for obj_id in chunk:
+                    for future in pending[obj_id]:
+                        if not future.done():
+                            future.set_exception(exc)
+                continue
+            rows_by_id = {row[id_index]: row for row in rows}
+            for obj_id in chunk:
+                row = rows_by_id.get(obj_id)
+                for future in pending[obj_id]:
+                    if not future.done():
+                        future.set_result(row)
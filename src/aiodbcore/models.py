@@ -7,26 +7,46 @@ from contextlib import suppress
 from datetime import date, datetime, time
 from enum import Enum
 from functools import wraps
-from inspect import isclass
+from inspect import Parameter, isclass, signature as get_signature
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+from .codecs import CompressedValue, JsonValue, TaggedValue
 from .operators import (
     AddOperator,
     CmpOperator,
     ContainedCmpOperator,
     DivideOperator,
     EqCmpOperator,
+    FieldRef,
+    FullTextMatchOperator,
+    FullTextRank,
     GeCmpOperator,
     GtCmpOperator,
     InvertedField,
     IsNullCmpOperator,
+    JsonContainsOperator,
+    JsonPath,
     LeCmpOperator,
     LtCmpOperator,
     MathOperator,
     MultiplyOperator,
     NeCmpOperator,
+    NotOperator,
+    Operator,
     SubOperator,
+    Subquery,
+)
+from .tools import (
+    LazyValue,
+    convert_type,
+    is_json_type,
+    update_hash,
+    watch_changes,
 )
-from .tools import convert_type, watch_changes
 
 LT_GT_SUPPORTED = {int, float, datetime, date, time}
 MATH_SUPPORTED = {int, float}
@@ -65,8 +85,29 @@ def field_operator[T, **P, RT: CmpOperator](
             IsNullCmpOperator,
             ContainedCmpOperator,
         }:
+            if isinstance(other, Field):
+                return op(str(self), FieldRef(str(other)))
             if not self.compare_type(type(other)):
                 raise TypeError(f"unable to compare {self!r} and {other!r}")
+        if (
+            isinstance(self.python_type, UnionType)
+            and self.python_type.tagged
+            and op in {EqCmpOperator, NeCmpOperator, ContainedCmpOperator}
+            and not isinstance(other, Subquery)
+            and other is not None
+        ):
+            # rows written before tagging store values without tag
+            values = list(other) if op is ContainedCmpOperator else [other]
+            values = [*map(self.dump, values), *values]
+            if op is NeCmpOperator:
+                return NotOperator(ContainedCmpOperator(str(self), values))
+            return ContainedCmpOperator(str(self), values)
+        # values are compared with stored values:
+        # tagged values of unions, JSON values of JSON fields
+        if op is ContainedCmpOperator and not isinstance(other, Subquery):
+            other = [self.dump(x) for x in other]
+        elif op is not IsNullCmpOperator:
+            other = self.dump(other)
         return op(str(self), other)
 
     return _wrapper
@@ -109,14 +150,20 @@ class Field[T]:
         self.unique: bool | None = None
         self.sql_type: SpecificSQLType | None = None
         self.index: Index | None = None
+        self.full_text: FullText | None = None
+        self.compressed: Compressed | None = None
+        self.lazy: bool = False
         self.eq: bool | None = None
         self.lt_gt: bool | None = None
+        self.json: bool = False
 
     def __set_name__(self, owner: type, name: str):
         self.model_name = owner.__name__
         self.name = name
 
     def __get__(self, obj: object | None, owner: type):
+        # `Field` is non-data descriptor, values are read from
+        # the instance `__dict__` without calling this method.
         if self._first:
             self._first = False
             return self.default_value
@@ -124,8 +171,11 @@ class Field[T]:
             return self
         return obj.__dict__[self.name]
 
-    def __set__(self, obj, value: T):
-        obj.__dict__[self.name] = value
+    def is_loaded(self, obj: object) -> bool:
+        """
+        :returns: False if value of lazy field is not decoded yet.
+        """
+        return type(obj.__dict__.get(self.name)) is not LazyValue
 
     def init(
         self,
@@ -137,6 +187,9 @@ class Field[T]:
         index: Index | None = None,
         eq: bool = True,
         lt_gt: bool = False,
+        full_text: FullText | None = None,
+        compressed: Compressed | None = None,
+        lazy: bool = False,
     ) -> None:
         """
         Initialize `Field` instance.
@@ -151,6 +204,9 @@ class Field[T]:
         :param index: Index of this field.
         :param eq: Are equation operators available for this field?
         :param lt_gt: Are comparing operators available for this field?
+        :param full_text: Full-text search settings of this field.
+        :param compressed: Compression settings of this field.
+        :param lazy: Is value decoded on first access?
         """
         self.model_name = model_name
         self.name = name
@@ -160,8 +216,27 @@ class Field[T]:
         self.index = index
         self.eq = eq
         self.lt_gt = lt_gt
+        self.full_text = full_text
+        self.compressed = compressed
+        self.lazy = lazy
+        self.json = is_json_type(python_type)
         self.inited = True
 
+    def dump(self, value: T) -> ty.Any:
+        """
+        Prepares value of this field to be passed to db.
+        Values of union fields get type tag.
+        Values of JSON fields are wrapped to be stored as JSON.
+        Values of compressed fields are wrapped to be compressed by provider.
+        """
+        if isinstance(self.python_type, UnionType):
+            value = self.python_type.tag(value)
+        if self.json and value is not None:
+            value = JsonValue(value)
+        if self.compressed is not None and value is not None:
+            return CompressedValue(value, self.compressed)
+        return value
+
     def compare_type(self, type_: ty.Any) -> bool:
         """
         Checks whether the field can be the specified type.
@@ -196,8 +271,10 @@ class Field[T]:
 
     @field_operator
     def contained(
-        self, sequence: list[T] | tuple[T, ...]
+        self, sequence: list[T] | tuple[T, ...] | Subquery
     ) -> ty.Type[ContainedCmpOperator]:
+        if isinstance(sequence, Subquery):
+            return ContainedCmpOperator
         for el in sequence:
             if not self.compare_type(type(el)):
                 raise TypeError(f"unable to compare {self!r} and `{el!r}`")
@@ -207,6 +284,51 @@ class Field[T]:
     def is_null(self) -> ty.Type[IsNullCmpOperator]:
         return IsNullCmpOperator
 
+    def __getitem__(self, key: str | int) -> JsonPath:
+        """
+        Extracts value from JSON field (dict, list or dataclass).
+        """
+        self._check_json()
+        return JsonPath(str(self), (key,))
+
+    def contains(self, value: dict | list) -> JsonContainsOperator:
+        """
+        Checks JSON field contains object or array.
+        """
+        self._check_json()
+        if not isinstance(value, (dict, list)):
+            raise TypeError(f"{value!r} is not JSON object or array")
+        return JsonContainsOperator(str(self), JsonValue(value))
+
+    def match(self, query: str) -> FullTextMatchOperator:
+        """
+        Full-text search by field with `FullText` modifier.
+        :param query: search query in syntax of db
+            (FTS5 query on sqlite, `websearch_to_tsquery` on postgresql).
+        """
+        return FullTextMatchOperator(*self._get_full_text_args(), query)
+
+    def rank(self, query: str) -> FullTextRank:
+        """
+        Relevance of rows to full-text search query, used in `order_by`.
+        Rows that match better come first.
+        :param query: search query.
+        """
+        return FullTextRank(*self._get_full_text_args(), query)
+
+    def _get_full_text_args(self) -> tuple[str, str, str]:
+        if not self.inited:
+            raise RuntimeError(f"Model '{self.model_name}' is not initialized")
+        if self.full_text is None:
+            raise TypeError(f"{self!r} has no `FullText` modifier")
+        return self.model_name, self.name, self.full_text.language
+
+    def _check_json(self) -> None:
+        if not self.inited:
+            raise RuntimeError(f"Model '{self.model_name}' is not initialized")
+        if not self.json:
+            raise TypeError(f"{self!r} is not JSON field")
+
     def __invert__(self) -> InvertedField:
         return InvertedField(str(self))
 
@@ -227,7 +349,7 @@ class Field[T]:
         return DivideOperator
 
     def __hash__(self):
-        return hash(self.name)
+        return hash((self.model_name, self.name))
 
     def __str__(self):
         return f'"{self.model_name}".{self.name}'
@@ -250,6 +372,10 @@ class ModelSignature:
 
     name: str
     fields: list[Field] = dataclasses.field(default_factory=list)
+    track_changes: bool = True
+    """ model is wrapped by `watch_changes` """
+    positional_init: bool = False
+    """ model is constructed by positional arguments in order of fields """
 
 
 class UnionType[T: ty.Any]:
@@ -262,11 +388,38 @@ class UnionType[T: ty.Any]:
         self.nullable = tys.NoneType in self.types
         if self.nullable:
             self.types.remove(tys.NoneType)  # type: ignore
+        self.tagged = len(self.types) > 1 and not set(self.types) <= {
+            int,
+            float,
+        }
+        """
+        values are stored with type tag.
+        numbers are stored as is, so they can be compared and sorted by db
+        """
+        self.tags: dict[type, str] = {
+            (origin := ty.get_origin(x) or x): origin.__name__
+            for x in self.types
+        }
+        """ {type: tag} """
+
+    def tag(self, value: ty.Any) -> ty.Any:
+        """
+        Wraps value into `TaggedValue` if union has several types.
+        Values of unknown types are returned as is.
+        """
+        if not self.tagged or value is None:
+            return value
+        for klass in type(value).__mro__:
+            if (tag := self.tags.get(klass)) is not None:
+                return TaggedValue(tag, value)
+        return value
 
     def __call__(self, obj: ty.Any) -> T:
         """
         Wrapping obj to suitable data type.
         """
+        if type(obj) in self.types:
+            return obj
         for type_ in self.types:
             with suppress(ValueError, TypeError):
                 return convert_type(obj, type_)
@@ -282,28 +435,126 @@ class UnionType[T: ty.Any]:
         )
 
 
-def prepare_model(model: ty.Type[ty.Any]) -> ModelSignature:
+class DataField[T](Field[T]):
+    """
+    Field that intercepts reading and writing of instance attribute.
+    It is used for lazy fields and for models prepared without fast access.
+    """
+
+    def __get__(self, obj: object | None, owner: type):
+        if self._first:
+            self._first = False
+            return self.default_value
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name]
+        if type(value) is LazyValue:
+            value = obj.__dict__[self.name] = value.load()
+            update_hash(obj, self.name)
+        return value
+
+    def __set__(self, obj, value: T):
+        obj.__dict__[self.name] = value
+
+
+class SlotField[T](DataField[T]):
+    """
+    Field of model that stores values in `__slots__`
+    (msgspec Struct, dataclass with `slots=True`).
+    Values are read and written through the original slot descriptor.
+    """
+
+    def __init__(self, default_value: T, slot: tys.MemberDescriptorType):
+        super().__init__(default_value)
+        self.slot = slot
+
+    def __get__(self, obj: object | None, owner: type):
+        if self._first:
+            self._first = False
+            return self.default_value
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if type(value) is LazyValue:
+            value = value.load()
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value: T):
+        self.slot.__set__(obj, value)
+
+    def is_loaded(self, obj: object) -> bool:
+        return type(self.slot.__get__(obj, type(obj))) is not LazyValue
+
+
+def _is_struct(model: type) -> bool:
+    return msgspec is not None and issubclass(model, msgspec.Struct)
+
+
+def _is_positional_init(model: type, field_names: list[str]) -> bool:
+    """
+    Checks model can be constructed by positional arguments
+    in order of its fields.
+    """
+    try:
+        parameters = list(get_signature(model).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    return [
+        parameter.name
+        for parameter in parameters
+        if parameter.kind is Parameter.POSITIONAL_OR_KEYWORD
+    ] == field_names and len(parameters) == len(field_names)
+
+
+def prepare_model(
+    model: ty.Type[ty.Any], fast_access: bool = True
+) -> ModelSignature:
     """
     Prepares model to work in db context.
     Wraps model into `watch_changes`.
     Replaces class attributes onto `ModelField` instances.
-    :param model: dataclass.
+    :param model: dataclass, msgspec Struct or class with `__slots__`.
+        Changes of instances without `__dict__` are not tracked,
+        so saving them updates all fields.
+    :param fast_access: Read attributes of instances without `Field` calls.
+        Fields are non-data descriptors, so they are used for
+        class attribute access only (e.g. `User.id == 1`).
+        False - every access goes through `DataField`.
+        Lazy fields are always `DataField`.
     :returns: signature of model.
     """
     if hasattr(model, "__aiodbc__"):
         return getattr(model, "__aiodbc__")
-    if not dataclasses.is_dataclass(model):
-        raise TypeError(f"Model `{model.__name__}` is not a dataclass")
-    watch_changes(model)
-    signature = ModelSignature(model_name := model.__name__)
-    for field_name, field_type in ty.get_type_hints(
-        model, include_extras=True
-    ).items():
-        unique = False
-        sql_type = index = None
+    type_hints = ty.get_type_hints(model, include_extras=True)
+    slots = {
+        field_name: slot
+        for field_name in type_hints
+        if isinstance(
+            slot := getattr(model, field_name, None), tys.MemberDescriptorType
+        )
+    }
+    if not (
+        dataclasses.is_dataclass(model)
+        or _is_struct(model)
+        or (slots and len(slots) == len(type_hints))
+    ):
+        raise TypeError(
+            f"Model `{model.__name__}` is not a dataclass, "
+            "msgspec Struct or class with `__slots__`"
+        )
+    if track_changes := not slots:
+        watch_changes(model)
+    signature = ModelSignature(
+        model_name := model.__name__, track_changes=track_changes
+    )
+    for field_name, field_type in type_hints.items():
+        unique = lazy = False
+        sql_type = index = full_text = compressed = None
         if ty.get_origin(field_type) is ty.Annotated:
             metadata = field_type.__metadata__
             unique = FieldMod.UNIQUE in metadata
+            lazy = FieldMod.LAZY in metadata
             sql_type = next(
                 filter(lambda x: isinstance(x, SpecificSQLType), metadata), None
             )
@@ -313,14 +564,40 @@ def prepare_model(model: ty.Type[ty.Any]) -> ModelSignature:
             )
             if index is Index:
                 index = Index(f"{field_name}_idx")
+            full_text = next(
+                filter(
+                    lambda x: isinstance(x, FullText) or x is FullText,
+                    metadata,
+                ),
+                None,
+            )
+            if full_text is FullText:
+                full_text = FullText()
+            compressed = next(
+                filter(
+                    lambda x: isinstance(x, Compressed) or x is Compressed,
+                    metadata,
+                ),
+                None,
+            )
+            if compressed is Compressed:
+                compressed = Compressed()
             field_type = ty.get_args(field_type)[0]
         if ty.get_origin(field_type) is Field:
             field_type = ty.get_args(field_type)[0]
-        field = Field(getattr(model, field_name, None))
+        if (slot := slots.get(field_name)) is not None:
+            field: Field = SlotField(None, slot)
+        else:
+            field = (Field if fast_access and not lazy else DataField)(
+                getattr(model, field_name, None)
+            )
         lt_gt = field_type in LT_GT_SUPPORTED
         if ty.get_origin(field_type) in {ty.Union, tys.UnionType}:
             field_type = UnionType(*ty.get_args(field_type))
-            lt_gt = any(field_type.is_contains_type(x) for x in LT_GT_SUPPORTED)
+            # tagged values are compared by db as blobs
+            lt_gt = not field_type.tagged and any(
+                field_type.is_contains_type(x) for x in LT_GT_SUPPORTED
+            )
         field.init(
             model_name=model_name,
             name=field_name,
@@ -328,8 +605,11 @@ def prepare_model(model: ty.Type[ty.Any]) -> ModelSignature:
             unique=unique,
             sql_type=sql_type,
             index=index,
-            eq=True,
-            lt_gt=lt_gt,
+            eq=compressed is None,
+            lt_gt=lt_gt and compressed is None,
+            full_text=full_text,
+            compressed=compressed,
+            lazy=lazy,
         )
         signature.fields.append(field)
         setattr(model, field_name, field)
@@ -344,6 +624,9 @@ def prepare_model(model: ty.Type[ty.Any]) -> ModelSignature:
         raise TypeError(
             f"`id` attribute of model `{model.__name__}` should contains `int`"
         )
+    signature.positional_init = _is_positional_init(
+        model, [field.name for field in signature.fields]
+    )
 
     setattr(model, "__aiodbc__", signature)
     return signature
@@ -351,6 +634,8 @@ def prepare_model(model: ty.Type[ty.Any]) -> ModelSignature:
 
 class FieldMod(Enum):
     UNIQUE = "unique"
+    LAZY = "lazy"
+    """ value is decoded on first access, useful for large JSON fields """
 
 
 class SpecificSQLType(str):
@@ -358,6 +643,91 @@ class SpecificSQLType(str):
 
 
 class Index:
-    def __init__(self, name: str, unique: bool = False):
+    """
+    Index of field.
+    Fields that have indexes with the same name form composite index
+    in order of declaration.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        unique: bool = False,
+        *,
+        desc: bool = False,
+        where: Operator | ty.Callable[[], Operator] | None = None,
+        include: ty.Sequence[Field | str] = (),
+        expression: str | None = None,
+        using: str | None = None,
+    ):
+        """
+        :param name: Name of index.
+        :param unique: Is this index unique?
+        :param desc: Sort this field in descending order.
+        :param where: Condition of partial index.
+            Pass a function if condition uses fields of the model itself,
+            for example `lambda: Item.deleted == False`.
+        :param include: Fields stored in the index but not used as key.
+            Supported by postgresql, ignored by sqlite.
+        :param expression: SQL expression indexed instead of the field,
+            `{}` is replaced with the field name. For example `lower({})`.
+        :param using: Index access method, for example `gin` for
+            containment of JSON fields. Supported by postgresql,
+            ignored by sqlite.
+        """
         self.name = name
         self.unique = unique
+        self.desc = desc
+        self.where = where
+        self.include = include
+        self.expression = expression
+        self.using = using
+
+
+class FullText:
+    """
+    Full-text search modifier of text field.
+    On sqlite fields are indexed by FTS5 table `<table>_fts`
+    kept in sync by triggers. On postgresql each field gets
+    generated tsvector column `<field>_tsv` with GIN index.
+    """
+
+    def __init__(
+        self, language: str = "english", tokenize: str = "unicode61"
+    ):
+        """
+        :param language: Text search configuration of postgresql.
+        :param tokenize: FTS5 tokenizer of sqlite. For example `porter unicode61`.
+            Tokenizer of the first field is used for all fields of the model.
+        """
+        if "'" in language or "'" in tokenize:
+            raise ValueError("language and tokenize can't contain quotes")
+        self.language = language
+        self.tokenize = tokenize
+
+
+class Compressed:
+    """
+    Compression of serialized field value.
+    Column of the field has `DEFAULT_FIELD_TYPE` of provider (BLOB, BYTEA).
+    Compressed fields can't be used in conditions.
+    """
+
+    def __init__(
+        self,
+        algorithm: ty.Literal["zstd", "zlib"] = "zstd",
+        level: int | None = None,
+        threshold: int = 1024,
+    ):
+        """
+        :param algorithm: `zstd` (requires `zstandard` before python 3.14)
+            or `zlib`. zlib is used if zstd is not available.
+        :param level: Compression level. None - default level of algorithm.
+        :param threshold: Values shorter than threshold (in bytes)
+            are stored without compression.
+        """
+        if algorithm not in {"zstd", "zlib"}:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.level = level
+        self.threshold = threshold
@@ -1,4 +1,5 @@
 import dataclasses
+import types as tys
 import typing as ty
 from enum import Enum
 
@@ -8,16 +9,22 @@ from .operators import (
     ContainedCmpOperator,
     DivideOperator,
     EqCmpOperator,
+    FullTextMatchOperator,
+    FullTextRank,
     GeCmpOperator,
     GtCmpOperator,
     InvertedField,
     IsNullCmpOperator,
+    JsonContainsOperator,
+    JsonPath,
     LeCmpOperator,
     LtCmpOperator,
     MathOperator,
     MultiplyOperator,
     NeCmpOperator,
+    Operator,
     SubOperator,
+    Subquery,
 )
 
 
@@ -40,14 +47,19 @@ class Field[T]:
         self.unique: bool
         self.sql_type: SpecificSQLType | None
         self.index: Index | None
+        self.full_text: FullText | None
+        self.compressed: Compressed | None
+        self.lazy: bool
         self.eq: bool
         self.lt_gt: bool
+        self.json: bool
 
     @ty.overload
     def __get__(self, obj: None, owner: type) -> ty.Self: ...
     @ty.overload
     def __get__(self, obj: object, owner: type) -> T: ...
     def __set__(self, obj: object, value: T) -> None: ...
+    def is_loaded(self, obj: object) -> bool: ...
     def init(
         self,
         model_name: str,
@@ -58,26 +70,34 @@ class Field[T]:
         index: Index | None = None,
         eq: bool = True,
         lt_gt: bool = False,
+        full_text: FullText | None = None,
+        compressed: Compressed | None = None,
+        lazy: bool = False,
     ) -> None: ...
+    def dump(self, value: T) -> ty.Any: ...
     def compare_type(self, type_: ty.Any) -> bool: ...
     @field_operator
-    def __eq__(self, other: T) -> ty.Type[EqCmpOperator]: ...
+    def __eq__(self, other: T | Field[T]) -> ty.Type[EqCmpOperator]: ...
     @field_operator
-    def __ne__(self, other: T) -> ty.Type[NeCmpOperator]: ...
+    def __ne__(self, other: T | Field[T]) -> ty.Type[NeCmpOperator]: ...
     @field_operator
-    def __lt__(self, other: T) -> ty.Type[LtCmpOperator]: ...
+    def __lt__(self, other: T | Field[T]) -> ty.Type[LtCmpOperator]: ...
     @field_operator
-    def __le__(self, other: T) -> ty.Type[LeCmpOperator]: ...
+    def __le__(self, other: T | Field[T]) -> ty.Type[LeCmpOperator]: ...
     @field_operator
-    def __gt__(self, other: T) -> ty.Type[GtCmpOperator]: ...
+    def __gt__(self, other: T | Field[T]) -> ty.Type[GtCmpOperator]: ...
     @field_operator
-    def __ge__(self, other: T) -> ty.Type[GeCmpOperator]: ...
+    def __ge__(self, other: T | Field[T]) -> ty.Type[GeCmpOperator]: ...
     @field_operator
     def contained(
-        self, sequence: list[T] | tuple[T, ...]
+        self, sequence: list[T] | tuple[T, ...] | Subquery
     ) -> ty.Type[ContainedCmpOperator]: ...
     @field_operator
     def is_null(self) -> ty.Type[IsNullCmpOperator]: ...
+    def __getitem__(self, key: str | int) -> JsonPath: ...
+    def contains(self, value: dict | list) -> JsonContainsOperator: ...
+    def match(self, query: str) -> FullTextMatchOperator: ...
+    def rank(self, query: str) -> FullTextRank: ...
     def __invert__(self) -> InvertedField: ...
     @math_operator
     def __add__(self, other: T) -> ty.Type[AddOperator]: ...
@@ -92,33 +112,87 @@ class Field[T]:
     def __repr__(self): ...
 
 
+class DataField[T](Field[T]): ...
+
+
+class SlotField[T](DataField[T]):
+    slot: tys.MemberDescriptorType
+
+    def __init__(
+        self, default_value: T, slot: tys.MemberDescriptorType
+    ): ...
+
+
 @dataclasses.dataclass
 class ModelSignature:
     name: str
     fields: list[Field]
+    track_changes: bool
+    positional_init: bool
 
 
 class UnionType[T: ty.Any]:
     def __init__(self, *types: ty.Type[T]):
         self.types: list[T]
         self.nullable: bool
+        self.tagged: bool
+        self.tags: dict[type, str]
 
+    def tag(self, value: ty.Any) -> ty.Any: ...
     def __call__(self, obj: ty.Any) -> T: ...
     def is_contains_type(self, type_: ty.Type) -> bool: ...
     def __repr__(self) -> str: ...
 
 
-def prepare_model(model: ty.Type) -> ModelSignature: ...
+def prepare_model(
+    model: ty.Type, fast_access: bool = True
+) -> ModelSignature: ...
 
 
 class FieldMod(Enum):
     UNIQUE: str
+    LAZY: str
 
 
 class SpecificSQLType(str): ...
 
 
 class Index:
-    def __init__(self, name: str, unique: bool = False):
+    def __init__(
+        self,
+        name: str,
+        unique: bool = False,
+        *,
+        desc: bool = False,
+        where: Operator | ty.Callable[[], Operator] | None = None,
+        include: ty.Sequence[Field | str] = (),
+        expression: str | None = None,
+        using: str | None = None,
+    ):
         self.name: str
         self.unique: bool
+        self.desc: bool
+        self.where: Operator | ty.Callable[[], Operator] | None
+        self.include: ty.Sequence[Field | str]
+        self.expression: str | None
+        self.using: str | None
+
+
+class FullText:
+    def __init__(
+        self, language: str = "english", tokenize: str = "unicode61"
+    ):
+        self.language: str
+        self.tokenize: str
+
+
+class Compressed:
+    def __init__(
+        self,
+        algorithm: ty.Literal["zstd", "zlib"] = "zstd",
+        level: int | None = None,
+        threshold: int = 1024,
+    ):
+        self.algorithm: ty.Literal["zstd", "zlib"]
+        self.level: int | None
+        self.threshold: int
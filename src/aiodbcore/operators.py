@@ -3,6 +3,8 @@ from __future__ import annotations
 import typing as ty
 from abc import ABC, abstractmethod
 
+from .codecs import JsonValue
+
 
 class Operator(ABC):
     """
@@ -27,6 +29,12 @@ class Operator(ABC):
     def __invert__(self) -> NotOperator:
         return NotOperator(self)
 
+    def get_subquery_tables(self) -> set[str]:
+        """
+        :returns: names of tables read by subqueries of this operator.
+        """
+        return set()
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -48,10 +56,13 @@ class CmpOperator(Operator, ABC):
         self.value = value
 
     def get_values(self) -> ty.Sequence[ty.Any]:
+        if isinstance(self.value, FieldRef):
+            return ()
         return (self.value,)
 
     def __repr__(self):
-        return f"{self.field_name} {self.sign} {{}}"
+        value = self.value if isinstance(self.value, FieldRef) else "{}"
+        return f"{self.field_name} {self.sign} {value}"
 
     __str__ = __repr__
 
@@ -81,12 +92,40 @@ class GeCmpOperator(CmpOperator):
 
 
 class ContainedCmpOperator(CmpOperator):
+    """
+    `IN` operator.
+    List of primitive values is passed as one array parameter
+    (see `BaseProvider.PLACEHOLDER_FORMATS`), so the query has the same shape
+    whatever the list length. Other values are passed one by one.
+    """
+
     sign = "IN"
+    ARRAY_TYPES = {int, float, str}
+    """ types of values that can be passed as array parameter """
+
+    def __init__(self, field_name: str, value: ty.Any):
+        super().__init__(field_name, value)
+        self.as_array = not isinstance(value, Subquery) and all(
+            type(x) in self.ARRAY_TYPES for x in value
+        )
 
     def get_values(self) -> ty.Sequence[ty.Any]:
+        if isinstance(self.value, Subquery):
+            return self.value.get_values()
+        if self.as_array:
+            return (ArrayParam(self.value),)
         return tuple(self.value)
 
+    def get_subquery_tables(self) -> set[str]:
+        if isinstance(self.value, Subquery):
+            return self.value.get_tables()
+        return set()
+
     def __repr__(self):
+        if isinstance(self.value, Subquery):
+            return f"{self.field_name} {self.sign} {self.value}"
+        if self.as_array:
+            return f"{self.field_name} {{:in_array}}"
         return f"{self.field_name} {self.sign} ({', '.join(['{}'] * len(self.value))})"
 
     __str__ = __repr__
@@ -107,6 +146,87 @@ class IsNullCmpOperator(CmpOperator):
     __str__ = __repr__
 
 
+class ExistsOperator(Operator):
+    sign = "EXISTS"
+
+    def __init__(self, subquery: Subquery):
+        self.subquery = subquery
+
+    def get_values(self) -> ty.Sequence[ty.Any]:
+        return self.subquery.get_values()
+
+    def get_subquery_tables(self) -> set[str]:
+        return self.subquery.get_tables()
+
+    def __repr__(self):
+        return f"{self.sign} {self.subquery}"
+
+    __str__ = __repr__
+
+
+class JsonContainsOperator(Operator):
+    """
+    Containment of JSON object or array (`@>` in postgresql).
+    Object contains other object if it has all its keys with the same values.
+    Array contains other array if it has all its elements.
+    """
+
+    sign = "@>"
+
+    def __init__(self, field_name: str, value: JsonValue):
+        """
+        :param field_name: JSON expression.
+        :param value: object or array which should be contained.
+        """
+        self.field_name = field_name
+        self.value = value
+
+    def get_values(self) -> ty.Sequence[ty.Any]:
+        return (self.value,)
+
+    def __repr__(self):
+        kind = "object" if isinstance(self.value.value, dict) else "array"
+        return f"{{:json_contains_{kind}|{self.field_name}}}"
+
+    __str__ = __repr__
+
+
+class FullTextMatchOperator(Operator):
+    """
+    Full-text search by field with `FullText` modifier.
+    SQL is taken from `fts_match` template of provider.
+    """
+
+    sign = "MATCH"
+
+    def __init__(
+        self, table_name: str, field_name: str, language: str, query: str
+    ):
+        """
+        :param table_name: name of table.
+        :param field_name: name of field.
+        :param language: text search configuration.
+        :param query: search query.
+        """
+        if not isinstance(query, str):
+            raise TypeError(f"search query should be str, not {query!r}")
+        self.table_name = table_name
+        self.field_name = field_name
+        self.language = language
+        self.query = query
+
+    def get_values(self) -> ty.Sequence[ty.Any]:
+        return (self.query,)
+
+    def __repr__(self):
+        return (
+            f"{{:fts_match|{self.table_name}|{self.field_name}"
+            f"|{self.language}}}"
+        )
+
+    __str__ = __repr__
+
+
 class LogicalOperator(Operator, ABC):
     """
     Base class for logical operators between two contained operators.
@@ -126,6 +246,12 @@ class LogicalOperator(Operator, ABC):
             *self.second_operand.get_values(),
         )
 
+    def get_subquery_tables(self) -> set[str]:
+        return (
+            self.first_operand.get_subquery_tables()
+            | self.second_operand.get_subquery_tables()
+        )
+
     def __str__(self):
         return f"{self.first_operand!r} {self.sign} {self.second_operand!r}"
 
@@ -150,12 +276,197 @@ class NotOperator(Operator):
     def get_values(self) -> ty.Sequence[ty.Any]:
         return self.operand.get_values()
 
+    def get_subquery_tables(self) -> set[str]:
+        return self.operand.get_subquery_tables()
+
     def __repr__(self):
         return f"{self.sign} ({self.operand})"
 
     __str__ = __repr__
 
 
+class Subquery:
+    """
+    Select query used as operand of `IN` and `EXISTS` operators.
+    Contains not pasted placeholders, they are pasted with outer query.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        values: ty.Sequence[ty.Any],
+        tables: ty.Iterable[str],
+    ):
+        """
+        :param query: SQL select statement with `{}` instead of placeholders.
+        :param values: statement params.
+        :param tables: names of tables read by the statement.
+        """
+        self.query = query
+        self.values = tuple(values)
+        self.tables = set(tables)
+
+    def get_values(self) -> ty.Sequence[ty.Any]:
+        return self.values
+
+    def get_tables(self) -> set[str]:
+        return self.tables
+
+    def __str__(self):
+        return f"({self.query})"
+
+
+class ArrayParam(tuple):
+    """
+    Values passed as one query parameter.
+    """
+
+
+class FieldRef:
+    """
+    Field used as operand of comparison instead of a value.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+
+    def __str__(self):
+        return self.field
+
+
+class JsonPath:
+    """
+    Value extracted from JSON field by path.
+
+    >>> Item.data["size"]["width"] > 10
+    >>> Item.data["tags"].contains(["sale"])
+    """
+
+    CASTS = ((bool, "BOOLEAN"), (int, "NUMERIC"), (float, "NUMERIC"))
+    """ SQL types which extracted value is cast to for comparison """
+
+    def __init__(self, field: str, path: tuple[str | int, ...]):
+        """
+        :param field: name of JSON field.
+        :param path: keys of objects and indexes of arrays.
+        """
+        for key in path:
+            if not isinstance(key, (str, int)) or isinstance(key, bool):
+                raise TypeError(
+                    f"JSON path key should be str or int, not {key!r}"
+                )
+            if isinstance(key, str) and any(x in key for x in "{}|"):
+                raise ValueError(
+                    f"JSON path key can't contain braces and `|`: {key!r}"
+                )
+        self.field = field
+        self.path = path
+
+    def __getitem__(self, key: str | int) -> JsonPath:
+        return JsonPath(self.field, (*self.path, key))
+
+    def json(self) -> str:
+        """
+        :returns: SQL expression of JSON value.
+        """
+        return f"({self.field}{''.join(f' -> {self._key(x)}' for x in self.path)})"
+
+    def text(self, value_type: type | None = None) -> str:
+        """
+        :param value_type: type of compared value.
+        :returns: SQL expression of scalar value.
+        """
+        *path, last = self.path
+        expr = (
+            f"({self.field}{''.join(f' -> {self._key(x)}' for x in path)}"
+            f" ->> {self._key(last)})"
+        )
+        for python_type, sql_type in self.CASTS:
+            if value_type is not None and issubclass(value_type, python_type):
+                return f"CAST({expr} AS {sql_type})"
+        return expr
+
+    @staticmethod
+    def _key(key: str | int) -> str:
+        if isinstance(key, int):
+            return str(key)
+        return "'{}'".format(key.replace("'", "''"))
+
+    def _cmp(self, op: ty.Type[CmpOperator], other: ty.Any) -> CmpOperator:
+        if other is None or isinstance(other, (dict, list)):
+            raise TypeError(
+                f"unable to compare {self!r} and {other!r}, "
+                "use `is_null` or `contains`"
+            )
+        if isinstance(other, bool):
+            # bool params are not portable, so literal is used
+            return op(self.text(bool), FieldRef("TRUE" if other else "FALSE"))
+        return op(self.text(type(other)), other)
+
+    def __eq__(self, other: ty.Any) -> EqCmpOperator:  # type: ignore
+        return self._cmp(EqCmpOperator, other)
+
+    def __ne__(self, other: ty.Any) -> NeCmpOperator:  # type: ignore
+        return self._cmp(NeCmpOperator, other)
+
+    def __lt__(self, other: ty.Any) -> LtCmpOperator:
+        return self._cmp(LtCmpOperator, other)
+
+    def __le__(self, other: ty.Any) -> LeCmpOperator:
+        return self._cmp(LeCmpOperator, other)
+
+    def __gt__(self, other: ty.Any) -> GtCmpOperator:
+        return self._cmp(GtCmpOperator, other)
+
+    def __ge__(self, other: ty.Any) -> GeCmpOperator:
+        return self._cmp(GeCmpOperator, other)
+
+    def contained(self, sequence: list | tuple) -> ContainedCmpOperator:
+        if not sequence:
+            raise ValueError("sequence should not be empty")
+        return ContainedCmpOperator(self.text(type(sequence[0])), sequence)
+
+    def is_null(self) -> IsNullCmpOperator:
+        return IsNullCmpOperator(self.text(), None)
+
+    def contains(self, value: dict | list) -> JsonContainsOperator:
+        if not isinstance(value, (dict, list)):
+            raise TypeError(f"{value!r} is not JSON object or array")
+        return JsonContainsOperator(self.json(), JsonValue(value))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return f"<JsonPath {self.json()}>"
+
+
+class FullTextRank:
+    """
+    Relevance of row to full-text search query, used in `order_by`.
+    SQL is taken from `fts_rank` template of provider,
+    rows that match better come first.
+    """
+
+    def __init__(
+        self, table_name: str, field_name: str, language: str, query: str
+    ):
+        if not isinstance(query, str):
+            raise TypeError(f"search query should be str, not {query!r}")
+        self.table_name = table_name
+        self.field_name = field_name
+        self.language = language
+        self.query = query
+
+    def get_values(self) -> ty.Sequence[ty.Any]:
+        return (self.query,)
+
+    def __str__(self):
+        return (
+            f"{{:fts_rank|{self.table_name}|{self.field_name}"
+            f"|{self.language}}}"
+        )
+
+
 class InvertedField:
     def __init__(self, field: str):
         self.field = field
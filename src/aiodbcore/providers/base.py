@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 import dataclasses
+import os
 import string
 import typing as ty
 from abc import ABC, abstractmethod
 from contextlib import suppress
 from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
 from functools import wraps
 from inspect import isclass
 
 import orjson
 
-from ..exceptions import QueryError
-from ..tools import Construct, convert_type
+from .. import codecs, compress
+from ..codecs import CompressedValue, JsonValue, TaggedValue
+from ..exceptions import DBError, QueryError
+from ..models import UnionType
+from ..operators import ArrayParam
+from ..tools import Construct, convert_type, is_json_type
+
+if ty.TYPE_CHECKING:
+    from ..models import Field, FullText
 
 type Query = str
 type CreateTableQuery = Query
@@ -22,6 +31,28 @@ type SelectQuery = Query
 type UpdateQuery = Query
 type DeleteQuery = Query
 type DropTableQuery = Query
+type Encoder = ty.Callable[[ty.Any], ty.Any]
+type Decoder = ty.Callable[[ty.Any], ty.Any]
+
+JSON_NATIVE_TYPES = {str, int, float, bool, dict, list}
+""" types that are restored by orjson without conversion """
+
+_pid = os.getpid()
+""" id of current process, it is updated in child process after fork """
+_inherited_connections: list[ty.Any] = []
+"""
+connections opened by parent process before fork.
+They are never closed by child, closing breaks them in parent.
+"""
+
+
+def _update_pid() -> None:
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_update_pid)
 
 
 def translate_exceptions(func):
@@ -50,12 +81,45 @@ class BaseProvider[ConnType](ABC):
     will be used if the type of field is not defined in `TYPING_MAP`
     """
 
+    JSON_FIELD_TYPE = "TEXT"
+    """ data type of dicts, lists and dataclasses """
+
     PLACEHOLDER: ty.Callable[[int], str] = staticmethod(lambda _: "?")
     """
     indexed arguments placeholder.
     ty.Callable[[<arg_index>], <placeholder>]
     """
 
+    PLACEHOLDER_FORMATS = {
+        "in_array": "IN (SELECT value FROM json_each({}))",
+        "json_contains_object": (
+            "NOT EXISTS (SELECT 1 FROM json_each({0}) AS c "
+            "WHERE json_extract({1}, '$.\"' || c.key || '\"') "
+            "IS NOT c.value)"
+        ),
+        "json_contains_array": (
+            "NOT EXISTS (SELECT 1 FROM json_each({0}) AS c "
+            "WHERE c.value NOT IN (SELECT value FROM json_each({1})))"
+        ),
+        "fts_match": (
+            '"{1}".id IN (SELECT rowid FROM "{1}_fts" '
+            'WHERE "{1}_fts".{2} MATCH {0})'
+        ),
+        "fts_rank": (
+            '(SELECT rank FROM "{1}_fts" WHERE "{1}_fts".rowid = "{1}".id '
+            'AND "{1}_fts".{2} MATCH {0})'
+        ),
+    }
+    """
+    SQL templates of placeholders with format spec.
+    `{:in_array}` - `IN` operator with array parameter.
+    `{:json_contains_object|<field>}` - JSON field contains object parameter.
+    `{:json_contains_array|<field>}` - JSON field contains array parameter.
+    `{:fts_match|<table>|<field>|<language>}` - full-text search.
+    `{:fts_rank|<table>|<field>|<language>}` - relevance of row
+        to full-text search query, ascending order puts best rows first.
+    """
+
     """ SQL queries templates """
     CREATE_TABLE_QUERY_TEMPLATE: CreateTableQuery = (
         'CREATE TABLE IF NOT EXISTS "{table_name}" '
@@ -77,8 +141,16 @@ class BaseProvider[ConnType](ABC):
     CREATE_TABLE_FIELD_TEMPLATE = "{field_name} {type}{unique}"
     UNIQUE_FIELD = "UNIQUE"
     CREATE_INDEX_TEMPLATE = (
-        'CREATE {unique}INDEX IF NOT EXISTS {name} ON "{table_name}"({fields})'
+        "CREATE {unique}INDEX IF NOT EXISTS {name} "
+        'ON "{table_name}"{using}({fields}){include}{where}'
     )
+    INDEX_USING_TEMPLATE: str | None = None
+    """ template of index access method. None - not supported """
+    INDEX_INCLUDE_TEMPLATE: str | None = None
+    """ template of covering index columns. None - not supported """
+    BYTES_LITERAL_TEMPLATE = "X'{}'"
+    MAX_QUERY_PARAMS = 32766
+    """ max count of params in one statement """
 
     connections_pool: ty.Any
     connection: ConnType | None
@@ -90,6 +162,8 @@ class BaseProvider[ConnType](ABC):
         """
         self.db_path = self.modify_db_path(db_path)
         self.connection_kwargs = connection_kwargs
+        self._pid = _pid
+        self._reset_codecs()
 
     @abstractmethod
     def create_connection(self):
@@ -114,6 +188,25 @@ class BaseProvider[ConnType](ABC):
         """
         raise NotImplementedError()
 
+    def _check_fork(self) -> None:
+        """
+        Resets connections inherited from parent process,
+        so child process (e.g. pre-fork server worker) opens its own.
+        """
+        if self._pid != _pid:
+            self._pid = _pid
+            self._after_fork()
+
+    def _after_fork(self) -> None:
+        """
+        Forgets connections of parent process without closing them.
+        Providers also recreate their locks, they could be held on fork.
+        """
+        for name in ("connection", "connections_pool"):
+            if (connection := getattr(self, name, None)) is not None:
+                _inherited_connections.append(connection)
+                setattr(self, name, None)
+
     @abstractmethod
     @translate_exceptions
     def execute(self, query: Query, args: ty.Sequence[ty.Any] = ()):
@@ -129,6 +222,70 @@ class BaseProvider[ConnType](ABC):
     def _execute(self, query: Query, args: ty.Sequence[ty.Any] = ()) -> ty.Any:
         raise NotImplementedError()
 
+    @abstractmethod
+    @translate_exceptions
+    def execute_many(
+        self, query: Query, args: ty.Sequence[ty.Sequence[ty.Any]] = ()
+    ):
+        """
+        Executes SQL query for each params set in one transaction.
+        :param query: SQL statement.
+        :param args: list of statement params.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def execute_batch(
+        self,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ):
+        """
+        Executes each SQL query for each its params set,
+        all queries in one transaction.
+        :param queries: list of SQL statements and lists of their params.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _execute_batch(
+        self,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ) -> ty.Any:
+        """
+        Errors are translated with query that caused them.
+        """
+        raise NotImplementedError()
+
+    def _adapt_batch(
+        self,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ) -> list[tuple[Query, list[tuple[ty.Any, ...]]]]:
+        adapted = []
+        for query, args in queries:
+            try:
+                rows = [tuple(map(self.adapt_value, row)) for row in args]
+            except Exception as e:
+                raise self._translate_exception(e, query, args)
+            adapted.append((query, rows))
+        return adapted
+
+    def _translate_batch_exception(
+        self,
+        exception: Exception,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ) -> DBError:
+        """
+        Translates error which is not caused by one of queries
+        (e.g. of `BEGIN` or `COMMIT`).
+        """
+        if isinstance(exception, DBError):
+            return exception
+        return self._translate_exception(
+            exception,
+            "; ".join(query for query, _ in queries),
+            [args for _, args in queries],
+        )
+
     @abstractmethod
     def executescript(self, query: Query) -> ty.Any:
         raise NotImplementedError()
@@ -157,14 +314,86 @@ class BaseProvider[ConnType](ABC):
         index_name: str,
         field_names: ty.Sequence[str],
         unique: bool = False,
+        where: str | None = None,
+        where_values: ty.Sequence[ty.Any] = (),
+        include: ty.Sequence[str] = (),
+        using: str | None = None,
     ) -> str:
+        """
+        :param field_names: indexed columns or expressions with sort order.
+        :param where: condition of partial index.
+        :param where_values: values of condition, they are pasted as literals.
+        :param include: non-key columns of covering index.
+        :param using: index access method.
+        """
         return self.CREATE_INDEX_TEMPLATE.format(
             unique="UNIQUE " if unique else "",
             name=index_name,
             table_name=table_name,
             fields=", ".join(field_names),
+            using=(
+                self.INDEX_USING_TEMPLATE.format(method=using)
+                if using and self.INDEX_USING_TEMPLATE is not None
+                else ""
+            ),
+            include=(
+                self.INDEX_INCLUDE_TEMPLATE.format(fields=", ".join(include))
+                if include and self.INDEX_INCLUDE_TEMPLATE is not None
+                else ""
+            ),
+            where=(
+                f" WHERE {self._paste_literals(where, where_values)}"
+                if where is not None
+                else ""
+            ),
         )
 
+    def prepare_full_text_queries(
+        self, table_name: str, fields: dict[str, FullText]
+    ) -> list[str]:
+        """
+        Creates FTS5 table indexing `fields` and triggers
+        keeping it in sync with the table.
+        Rows inserted before the FTS table was created are not indexed,
+        use `INSERT INTO "<table>_fts"("<table>_fts") VALUES ('rebuild')`.
+        :param fields: {field_name: full-text search settings}
+        """
+        fts = f'"{table_name}_fts"'
+        names = ", ".join(fields)
+        old = ", ".join(f"old.{x}" for x in fields)
+        new = ", ".join(f"new.{x}" for x in fields)
+        insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {names}) "
+            f"VALUES ('delete', old.id, {old});"
+        )
+        trigger = (
+            'CREATE TRIGGER IF NOT EXISTS "{name}" AFTER {event} '
+            f'ON "{table_name}" BEGIN {{body}} END'
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+            f"content='{table_name}', content_rowid='id', "
+            f"tokenize='{next(iter(fields.values())).tokenize}')",
+            trigger.format(
+                name=f"{table_name}_fts_insert", event="INSERT", body=insert
+            ),
+            trigger.format(
+                name=f"{table_name}_fts_delete", event="DELETE", body=delete
+            ),
+            trigger.format(
+                name=f"{table_name}_fts_update",
+                event="UPDATE",
+                body=f"{delete} {insert}",
+            ),
+        ]
+
+    def prepare_drop_full_text_queries(self, table_name: str) -> list[str]:
+        """
+        :returns: queries which drop full-text index of table.
+        """
+        return [f'DROP TABLE IF EXISTS "{table_name}_fts"']
+
     def prepare_insert_query(
         self, table_name: str, field_names: ty.Sequence[str], rows: int
     ) -> InsertQuery:
@@ -209,16 +438,20 @@ class BaseProvider[ConnType](ABC):
         order_by: tuple[str | tuple[str, bool], ...] | None = None,
         limit: int | None = None,
         offset: int = 0,
+        paste_placeholders: bool = True,
     ) -> SelectQuery:
-        return self.SELECT_QUERY_TEMPLATE.format(
+        """
+        :param where: filtering statement with `{}` instead of placeholders.
+        :param order_by: fields or expressions (may contain placeholders
+            after placeholders of `where`) and sort order.
+        :param paste_placeholders: False - keep `{}` instead of placeholders,
+            it is used to prepare subquery.
+        """
+        query = self.SELECT_QUERY_TEMPLATE.format(
             table_name=table_name,
             fields=", ".join(fields) if fields else "*",
             join=f" {join}" if join else "",
-            where=(
-                f" WHERE {self._paste_placeholders(where)}"
-                if where is not None
-                else ""
-            ),
+            where=f" WHERE {where}" if where is not None else "",
             order_by=(
                 (
                     " ORDER BY "
@@ -236,6 +469,9 @@ class BaseProvider[ConnType](ABC):
             limit=f" LIMIT {limit}" if limit is not None else "",
             offset=f" OFFSET {offset}" if offset else "",
         )
+        if paste_placeholders:
+            return self._paste_placeholders(query)
+        return query
 
     @abstractmethod
     def fetchone(self, query: SelectQuery, args: ty.Sequence[ty.Any] = ()):
@@ -305,8 +541,17 @@ class BaseProvider[ConnType](ABC):
     def _get_sql_type(self, field_type: ty.Any) -> str:
         """
         :param field_type: Python data type.
-        :return: SQL data type from `TYPING_MAP` or `DEFAULT_FIELD_TYPE`.
+        :return: SQL data type from registered codec, `TYPING_MAP`,
+            `JSON_FIELD_TYPE` or `DEFAULT_FIELD_TYPE`.
         """
+        if (
+            codec := codecs.get_codec(
+                type(self), self._unwrap_optional(field_type)
+            )
+        ) is not None:
+            return codec.sql_type
+        if is_json_type(field_type):
+            return self.JSON_FIELD_TYPE
         return self.TYPING_MAP.get(
             (
                 field_type if isclass(field_type) else field_type.__class__
@@ -319,30 +564,177 @@ class BaseProvider[ConnType](ABC):
             [x[1] for x in string.Formatter().parse(query) if x[1] is not None]
         )
         return query.format(
-            *(self.PLACEHOLDER(i) for i in range(1, placeholders_count + 1))
+            *(
+                Placeholder(self.PLACEHOLDER(i), self.PLACEHOLDER_FORMATS)
+                for i in range(1, placeholders_count + 1)
+            )
         )
 
+    def _paste_literals(self, query: str, values: ty.Sequence[ty.Any]) -> str:
+        """
+        Pastes values into query as SQL literals.
+        Used where parameters are not allowed (e.g. condition of index).
+        """
+        literals = []
+        for value in values:
+            if isinstance(value, ArrayParam):
+                literal = Placeholder(
+                    ", ".join(self.literal(x) for x in value),
+                    {**self.PLACEHOLDER_FORMATS, "in_array": "IN ({})"},
+                )
+            else:
+                literal = Placeholder(
+                    self.literal(value), self.PLACEHOLDER_FORMATS
+                )
+            literals.append(literal)
+        return query.format(*literals)
+
+    def literal(self, obj: ty.Any) -> str:
+        """
+        Renders `obj` to SQL literal.
+        """
+        obj = self.adapt_value(obj)
+        if obj is None:
+            return "NULL"
+        if isinstance(obj, (dict, list)):
+            obj = orjson.dumps(obj).decode()
+        if isinstance(obj, (int, float)):
+            return str(obj)
+        if isinstance(obj, bytes):
+            return self.BYTES_LITERAL_TEMPLATE.format(obj.hex())
+        return "'{}'".format(str(obj).replace("'", "''"))
+
     def adapt_value(self, obj: ty.Any) -> ty.Any:
         """
         Adapts `obj` to suitable for db type.
+        Encoder is resolved once per type of value.
         """
-        if type(obj).__name__ in self.TYPING_MAP:
-            return obj
-        elif isinstance(obj, Enum):
-            obj = obj.value
-        elif isinstance(obj, (datetime, date, time)):
-            obj = obj.isoformat()
-        elif hasattr(obj, "to_dump"):
-            obj = obj.to_dump()
-        elif dataclasses.is_dataclass(obj):
-            if isclass(obj):
-                raise TypeError("Cannot adapt dataclass class")
-            obj = dataclasses.asdict(obj)
-        elif isinstance(obj, dict) and type(obj) is not dict:
-            obj = dict(obj)
-        elif isinstance(obj, list) and type(obj) is not list:
-            obj = list(obj)
-        return self._default_adapt_value(obj)
+        if self._codecs_generation != codecs.generation:
+            self._reset_codecs()
+        try:
+            encoder = self._encoders[type(obj)]
+        except KeyError:
+            encoder = self._get_encoder(type(obj))
+            self._encoders[type(obj)] = encoder
+        return encoder(obj)
+
+    def _get_encoder(self, type_: type) -> Encoder:
+        """
+        :returns: function which adapts values of `type_`.
+        """
+        for klass in type_.__mro__[:-1]:
+            if (codec := codecs.get_codec(type(self), klass)) is not None:
+                return codec.encode
+        if issubclass(type_, TaggedValue):
+            return self._adapt_tagged_value
+        if issubclass(type_, CompressedValue):
+            return self._adapt_compressed_value
+        if issubclass(type_, JsonValue):
+            return self._adapt_json_value
+        if issubclass(type_, ArrayParam):
+            return self._adapt_array_param
+        if type_.__name__ in self.TYPING_MAP:
+            return _identity
+        if issubclass(type_, Enum):
+            return lambda obj: self._default_adapt_value(obj.value)
+        if issubclass(type_, (datetime, date, time)):
+            return lambda obj: self._default_adapt_value(obj.isoformat())
+        if hasattr(type_, "to_dump"):
+            return lambda obj: self._default_adapt_value(obj.to_dump())
+        if dataclasses.is_dataclass(type_):
+            return lambda obj: self._default_adapt_value(
+                dataclasses.asdict(obj)
+            )
+        return self._default_adapt_value
+
+    def _adapt_json_value(self, obj: JsonValue) -> ty.Any:
+        """
+        Adapts value of JSON field to `JSON_FIELD_TYPE`.
+        Encoder is resolved once per type of value.
+        """
+        key = (JsonValue, type(obj.value))
+        try:
+            encoder = self._encoders[key]
+        except KeyError:
+            encoder = self._get_json_encoder(type(obj.value))
+            self._encoders[key] = encoder
+        return encoder(obj.value)
+
+    def _get_json_encoder(self, type_: type) -> Encoder:
+        """
+        :returns: function which adapts values of `type_` stored as JSON.
+        """
+        for klass in type_.__mro__[:-1]:
+            if (codec := codecs.get_codec(type(self), klass)) is not None:
+                return codec.encode
+        if dataclasses.is_dataclass(type_):
+            return lambda obj: self._adapt_json(dataclasses.asdict(obj))
+        if issubclass(type_, dict):
+            return lambda obj: self._adapt_json(dict(obj))
+        if issubclass(type_, list):
+            return lambda obj: self._adapt_json(list(obj))
+        return self.adapt_value
+
+    def _adapt_tagged_value(self, obj: TaggedValue) -> ty.Any:
+        """
+        Adapts value of union field to `DEFAULT_FIELD_TYPE` as `[tag, value]`.
+        """
+        return orjson.dumps(
+            [obj.tag, obj.value],
+            default=self._json_default,
+            option=(
+                orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            ),
+        )
+
+    def _adapt_compressed_value(self, obj: CompressedValue) -> bytes:
+        """
+        Serializes value of compressed field and compresses it.
+        """
+        value = self.adapt_value(obj.value)
+        if not isinstance(value, (bytes, str)):
+            value = orjson.dumps(value)
+        return compress.pack(
+            value,
+            obj.compressed.algorithm,
+            obj.compressed.level,
+            obj.compressed.threshold,
+        )
+
+    def _json_default(self, obj: ty.Any) -> ty.Any:
+        """
+        Converts values that orjson doesn't serialize.
+        """
+        for klass in type(obj).__mro__[:-1]:
+            if (codec := codecs.get_codec(type(self), klass)) is not None:
+                return codec.encode(obj)
+        if isinstance(obj, (datetime, date, time)):
+            return obj.isoformat()
+        if dataclasses.is_dataclass(obj):
+            return {
+                field.name: getattr(obj, field.name)
+                for field in dataclasses.fields(obj)
+            }
+        if hasattr(obj, "to_dump"):
+            return obj.to_dump()
+        if isinstance(obj, Decimal):
+            return str(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    @staticmethod
+    def _adapt_array_param(obj: ArrayParam) -> ty.Any:
+        """
+        Adapts values of `IN` operator to one parameter.
+        """
+        return orjson.dumps(list(obj)).decode()
+
+    @staticmethod
+    def _adapt_json(obj: dict | list) -> ty.Any:
+        """
+        Adapts `obj` to suitable type for `JSON_FIELD_TYPE`.
+        """
+        return orjson.dumps(obj).decode()
 
     @staticmethod
     def _default_adapt_value(obj: ty.Any) -> ty.Any:
@@ -351,6 +743,109 @@ class BaseProvider[ConnType](ABC):
         """
         return orjson.dumps(obj)
 
+    def get_decoder(self, field: Field) -> Decoder:
+        """
+        :returns: function which converts raw values of `field` from db.
+            It is resolved once per field.
+        """
+        if self._codecs_generation != codecs.generation:
+            self._reset_codecs()
+        key = (field.model_name, field.name)
+        try:
+            return self._decoders[key]
+        except KeyError:
+            decoder = self._get_decoder(field.python_type)
+            if field.compressed is not None:
+                decoder = self._get_decompressing_decoder(decoder)
+            self._decoders[key] = decoder
+            return decoder
+
+    def _get_decoder(self, python_type: ty.Any) -> Decoder:
+        if isinstance(python_type, UnionType) and python_type.tagged:
+            return self._get_union_decoder(python_type)
+        if (
+            codec := codecs.get_codec(
+                type(self), self._unwrap_optional(python_type)
+            )
+        ) is not None:
+            null = self.adapt_value(None)
+
+            def _decode(obj: ty.Any) -> ty.Any:
+                if obj is None or obj == null:
+                    return None
+                return codec.decode(obj)
+
+            return _decode
+        return lambda obj: self.convert_value(obj, python_type)
+
+    @staticmethod
+    def _get_decompressing_decoder(decoder: Decoder) -> Decoder:
+        """
+        :returns: decoder of compressed field.
+            Values stored before compression was enabled are passed as is.
+        """
+
+        def _decode(obj: ty.Any) -> ty.Any:
+            if compress.is_packed(obj):
+                obj = compress.unpack(obj)
+            return decoder(obj)
+
+        return _decode
+
+    def _get_union_decoder(self, python_type: UnionType) -> Decoder:
+        """
+        :returns: decoder of union field which looks up type by tag.
+        """
+        decoders = {
+            python_type.tags[ty.get_origin(x) or x]: (
+                self._get_payload_decoder(x)
+            )
+            for x in python_type.types
+        }
+
+        def _decode(obj: ty.Any) -> ty.Any:
+            if obj is None:
+                return None
+            if isinstance(obj, bytes):
+                value = self._default_convert_value(obj)
+                if value is None:
+                    return None
+                if (
+                    type(value) is list
+                    and len(value) == 2
+                    and type(value[0]) is str
+                    and (decoder := decoders.get(value[0])) is not None
+                ):
+                    return decoder(value[1])
+            # value stored without tag
+            return self.convert_value(obj, python_type)
+
+        return _decode
+
+    def _get_payload_decoder(self, python_type: ty.Any) -> Decoder:
+        """
+        :returns: decoder of value of union member restored from JSON.
+        """
+        if (codec := codecs.get_codec(type(self), python_type)) is not None:
+            return codec.decode
+        if python_type in JSON_NATIVE_TYPES:
+            return _identity
+        return lambda obj: convert_type(obj, python_type)
+
+    def _reset_codecs(self) -> None:
+        self._encoders: dict[type | tuple[type, type], Encoder] = {}
+        self._decoders: dict[tuple[str, str], Decoder] = {}
+        self._codecs_generation = codecs.generation
+
+    @staticmethod
+    def _unwrap_optional(python_type: ty.Any) -> ty.Any:
+        """
+        :returns: `T` for `T | None`.
+        """
+        if isinstance(python_type, UnionType) and len(python_type.types) == 1:
+            return python_type.types[0]
+        return python_type
+
     def convert_value[T](
         self, obj: ty.Any, python_type: Construct[T]
     ) -> T | None:
@@ -359,7 +854,13 @@ class BaseProvider[ConnType](ABC):
         """
         if type(obj) is python_type:
             return obj
-        if str(type(obj).__name__) in self.TYPING_MAP:
+        if isinstance(obj, (dict, list)) and is_json_type(python_type):
+            with suppress(ValueError, TypeError):
+                return convert_type(obj, python_type)
+            return None
+        if str(type(obj).__name__) in self.TYPING_MAP and not (
+            isinstance(obj, str) and is_json_type(python_type)
+        ):
             return python_type(obj)
 
         obj = self._default_convert_value(obj)
@@ -388,6 +889,30 @@ class BaseProvider[ConnType](ABC):
         return QueryError(query, params, exception)
 
 
+class Placeholder(str):
+    """
+    Query placeholder that supports format spec.
+    `{:<spec>}` is rendered by template from `BaseProvider.PLACEHOLDER_FORMATS`.
+    `{:<spec>|<arg>|...}` also pastes arguments into the template.
+    """
+
+    def __new__(cls, placeholder: str, formats: dict[str, str]):
+        obj = super().__new__(cls, placeholder)
+        obj.formats = formats
+        return obj
+
+    def __format__(self, format_spec: str) -> str:
+        """
+        :param format_spec: name of template and optional arguments
+            separated by `|`. Placeholder is pasted instead of `{0}`,
+            arguments instead of `{1}`, `{2}`...
+        """
+        if not format_spec:
+            return str(self)
+        name, *args = format_spec.split("|")
+        return self.formats[name].format(str(self), *args)
+
+
 class BaseConnectionWrapper[ConnType](ABC):
     def __init__(self, provider: BaseProvider[ConnType], lock):
         raise NotImplementedError()
@@ -396,3 +921,7 @@ class BaseConnectionWrapper[ConnType](ABC):
 class BasePoolConnectionWrapper[ConnType](ABC):
     def __init__(self, provider: BaseProvider[ConnType], pool_init_lock):
         raise NotImplementedError()
+
+
+def _identity(obj: ty.Any) -> ty.Any:
+    return obj
@@ -29,6 +29,9 @@ class BaseAsyncProvider[ConnType](BaseProvider[ConnType], ABC):
     ConnType : type of connection instance.
     """
 
+    SUPPORTS_COPY = False
+    """ provider implements `copy_records` """
+
     @abstractmethod
     def ensure_connection(
         self,
@@ -54,11 +57,43 @@ class BaseAsyncProvider[ConnType](BaseProvider[ConnType], ABC):
         args = tuple(self.adapt_value(arg) for arg in args)
         return await self._execute(query, args)
 
+    async def execute_many(
+        self, query: Query, args: ty.Sequence[ty.Sequence[ty.Any]] = ()
+    ):
+        return await self.execute_batch([(query, args)])
+
+    async def execute_batch(
+        self,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ):
+        queries = self._adapt_batch(queries)
+        try:
+            return await self._execute_batch(queries)
+        except Exception as e:
+            raise self._translate_batch_exception(e, queries)
+
     @translate_exceptions
     async def execute_insert_query(
         self, query: InsertQuery, args: ty.Sequence[ty.Any]
     ) -> list[int]:
         args = tuple(self.adapt_value(arg) for arg in args)
+        return await self._execute_insert(query, args)
+
+    async def copy_records(
+        self,
+        table_name: str,
+        field_names: ty.Sequence[str],
+        rows: ty.Sequence[ty.Sequence[ty.Any]],
+    ) -> None:
+        """
+        Bulk loads rows into table (`COPY` in PostgreSQL).
+        Rows are loaded without `RETURNING id`.
+        """
+        raise NotImplementedError()
+
+    async def _execute_insert(
+        self, query: InsertQuery, args: ty.Sequence[ty.Any]
+    ) -> list[int]:
         return [row[0] for row in await self._fetchall(query, args)]
 
     @translate_exceptions
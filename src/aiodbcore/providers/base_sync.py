@@ -45,6 +45,21 @@ class BaseSyncProvider[ConnType](BaseProvider[ConnType], ABC):
         args = tuple(self.adapt_value(arg) for arg in args)
         return self._execute(query, args)
 
+    def execute_many(
+        self, query: Query, args: ty.Sequence[ty.Sequence[ty.Any]] = ()
+    ):
+        return self.execute_batch([(query, args)])
+
+    def execute_batch(
+        self,
+        queries: ty.Sequence[tuple[Query, ty.Sequence[ty.Sequence[ty.Any]]]],
+    ):
+        queries = self._adapt_batch(queries)
+        try:
+            return self._execute_batch(queries)
+        except Exception as e:
+            raise self._translate_batch_exception(e, queries)
+
     @translate_exceptions
     def execute_insert_query(
         self, query: InsertQuery, args: ty.Sequence[ty.Any]
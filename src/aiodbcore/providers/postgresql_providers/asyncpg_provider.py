@@ -1,6 +1,11 @@
 import asyncio
+import copy
 import re
 import typing as ty
+from datetime import UTC, datetime
+from inspect import isclass
+
+import orjson
 
 try:
     import asyncpg
@@ -10,7 +15,9 @@ except ModuleNotFoundError as err:
         "Use `pip install asyncpg`"
     ) from err
 
+from ... import codecs
 from ...exceptions import UniqueRequiredError
+from ...models import UnionType
 from ..base_async import AsyncPoolConnectionWrapper, BaseAsyncProvider
 
 
@@ -23,8 +30,36 @@ class AsyncpgProvider(BaseAsyncProvider[asyncpg.Connection]):
         'INSERT INTO "{table_name}" ({fields}) VALUES {rows} RETURNING id'
     )
 
+    TYPING_MAP = {
+        **BaseAsyncProvider.TYPING_MAP,
+        "bool": "BOOLEAN",
+        "datetime": "TIMESTAMPTZ",
+        "date": "DATE",
+        "time": "TIME",
+        "UUID": "UUID",
+        "Decimal": "NUMERIC",
+    }
+    """
+    values of these types and lists of them are passed to asyncpg as is
+    and converted by its binary codecs
+    """
     DEFAULT_FIELD_TYPE = "BYTEA"
+    JSON_FIELD_TYPE = "JSONB"
+    INDEX_INCLUDE_TEMPLATE = " INCLUDE ({fields})"
+    INDEX_USING_TEMPLATE = " USING {method}"
+    BYTES_LITERAL_TEMPLATE = "'\\x{}'::bytea"
+    MAX_QUERY_PARAMS = 32767
+    SUPPORTS_COPY = True
     PLACEHOLDER: ty.Callable[[int], str] = staticmethod(lambda i: f"${i}")
+    PLACEHOLDER_FORMATS = {
+        "in_array": "= ANY({})",
+        "json_contains_object": "{1} @> {0}",
+        "json_contains_array": "{1} @> {0}",
+        "fts_match": "\"{1}\".{2}_tsv @@ websearch_to_tsquery('{3}', {0})",
+        "fts_rank": (
+            "-ts_rank(\"{1}\".{2}_tsv, websearch_to_tsquery('{3}', {0}))"
+        ),
+    }
 
     def __init__(self, db_path, **connection_kwargs) -> None:
         super().__init__(db_path, **connection_kwargs)
@@ -32,22 +67,81 @@ class AsyncpgProvider(BaseAsyncProvider[asyncpg.Connection]):
         self._pool_init_lock = asyncio.Lock()
 
     async def create_connection(self) -> None:
+        self._check_fork()
+        connection_kwargs = self.connection_kwargs.copy()
+        init = connection_kwargs.pop("init", None)
+
+        async def _init(connection: asyncpg.Connection) -> None:
+            await self._init_connection(connection)
+            if init is not None:
+                await init(connection)
+
         self.connections_pool = await asyncpg.create_pool(
-            self.db_path, min_size=1, max_size=5, **self.connection_kwargs
+            self.db_path,
+            min_size=1,
+            max_size=5,
+            init=_init,
+            **connection_kwargs,
+        )
+
+    @staticmethod
+    async def _init_connection(connection: asyncpg.Connection) -> None:
+        """
+        Registers binary JSONB codec which uses orjson.
+        """
+        await connection.set_type_codec(
+            "jsonb",
+            schema="pg_catalog",
+            encoder=lambda obj: b"\x01" + orjson.dumps(obj),
+            decoder=lambda data: orjson.loads(data[1:]),
+            format="binary",
         )
 
     async def close_connection(self) -> None:
-        await self.connections_pool.close()
+        self._check_fork()
+        if (pool := self.connections_pool) is not None:
+            self.connections_pool = None
+            if getattr(pool, "_loop", None) is asyncio.get_running_loop():
+                await pool.close()
+            else:
+                # pool of closed event loop can't be closed gracefully
+                pool.terminate()
 
     def ensure_connection(
         self,
     ) -> AsyncPoolConnectionWrapper[asyncpg.Connection]:
+        self._check_fork()
         return AsyncPoolConnectionWrapper(self, self._pool_init_lock)
 
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        self._pool_init_lock = asyncio.Lock()
+
     async def _execute(self, query, args=()):
         async with self.ensure_connection() as connection:
             return await connection.execute(query, *args)
 
+    async def _execute_batch(self, queries):
+        async with self.ensure_connection() as connection:
+            async with connection.transaction():
+                for query, args in queries:
+                    try:
+                        await connection.executemany(query, args)
+                    except Exception as e:
+                        raise self._translate_exception(e, query, args)
+
+    async def copy_records(self, table_name, field_names, rows):
+        records = [tuple(self.adapt_value(x) for x in row) for row in rows]
+        try:
+            async with self.ensure_connection() as connection:
+                await connection.copy_records_to_table(
+                    table_name, records=records, columns=list(field_names)
+                )
+        except Exception as e:
+            raise self._translate_exception(
+                e, f'COPY "{table_name}"', records
+            )
+
     async def executescript(self, query):
         async with self.ensure_connection() as connection:
             return await connection.execute(query)
@@ -60,6 +154,79 @@ class AsyncpgProvider(BaseAsyncProvider[asyncpg.Connection]):
         async with self.ensure_connection() as connection:
             return await connection.fetch(query, *args)
 
+    def prepare_full_text_queries(self, table_name, fields):
+        queries = []
+        for field_name, full_text in fields.items():
+            queries.append(
+                f'ALTER TABLE "{table_name}" ADD COLUMN IF NOT EXISTS '
+                f"{field_name}_tsv tsvector GENERATED ALWAYS AS "
+                f"(to_tsvector('{full_text.language}', "
+                f"coalesce({field_name}, ''))) STORED"
+            )
+            queries.append(
+                f'CREATE INDEX IF NOT EXISTS "{table_name}_{field_name}_tsv" '
+                f'ON "{table_name}" USING GIN ({field_name}_tsv)'
+            )
+        return queries
+
+    def prepare_drop_full_text_queries(self, table_name):
+        return []  # columns are dropped with the table
+
+    @staticmethod
+    def _adapt_array_param(obj):
+        return tuple(obj)
+
+    def _get_sql_type(self, field_type):
+        if isinstance(field_type, UnionType) and len(field_type.types) == 1:
+            field_type = field_type.types[0]
+        if (
+            ty.get_origin(field_type) is list
+            and len(args := ty.get_args(field_type)) == 1
+            and isclass(args[0])
+            and args[0].__name__ in self.TYPING_MAP
+        ):
+            return f"{self.TYPING_MAP[args[0].__name__]}[]"
+        return super()._get_sql_type(field_type)
+
+    def _get_encoder(self, type_):
+        if type_ is type(None):
+            return lambda _: None
+        if (
+            issubclass(type_, datetime)
+            and codecs.get_codec(type(self), type_) is None
+        ):
+            return self._adapt_datetime
+        return super()._get_encoder(type_)
+
+    @staticmethod
+    def _adapt_datetime(obj: datetime) -> datetime:
+        # asyncpg reads naive values of TIMESTAMPTZ as local time
+        if obj.tzinfo is None:
+            return obj.replace(tzinfo=UTC)
+        return obj
+
+    @staticmethod
+    def _adapt_json(obj):
+        # encoded by JSONB codec, lists for array columns
+        # are encoded by asyncpg as arrays
+        return obj
+
+    def convert_value(self, obj, python_type):
+        if obj is None:
+            return None
+        if isinstance(obj, (dict, list)):
+            # decoded JSONB and arrays of raw rows are shared by caches
+            # and coalesced reads, each instance gets its own copy
+            obj = copy.deepcopy(obj)
+        types = (
+            python_type.types
+            if isinstance(python_type, UnionType)
+            else (python_type,)
+        )
+        if any(isclass(x) and isinstance(obj, x) for x in types):
+            return obj  # decoded by asyncpg codecs
+        return super().convert_value(obj, python_type)
+
     @staticmethod
     def modify_db_path(db_path: str) -> str:
         return re.sub(r"\+asyncpg", "", db_path)
@@ -1,6 +1,7 @@
 import asyncio
 import re
 import typing as ty
+from contextlib import suppress
 
 from ...exceptions import UniqueRequiredError
 
@@ -15,30 +16,170 @@ except ModuleNotFoundError as err:
 from ..base_async import AsyncConnectionWrapper, BaseAsyncProvider
 
 
+WRITE_QUERY_RE = re.compile(r"\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.I)
+
+
 class AiosqliteProvider(BaseAsyncProvider[aiosqlite.Connection]):
     def __init__(self, db_path, **connection_kwargs) -> None:
+        """
+        :param connection_kwargs: params of `aiosqlite.connect` and
+            `group_commit_delay` - seconds during which concurrent
+            `INSERT`, `UPDATE` and `DELETE` queries are collected
+            to be committed by one transaction. None - every query
+            is committed separately.
+        """
         super().__init__(db_path, **connection_kwargs)
         self.connection = None
         self._lock = asyncio.Lock()
+        self.group_commit_delay: float | None = connection_kwargs.get(
+            "group_commit_delay"
+        )
+        self._writes: list[tuple[str, ty.Sequence, bool, asyncio.Future]] = []
+        self._commit_task: asyncio.Task | None = None
 
     async def create_connection(self) -> None:
+        self._check_fork()
         if not self.connection:
+            connection_kwargs = self.connection_kwargs.copy()
+            connection_kwargs.pop("group_commit_delay", None)
             self.connection = await aiosqlite.connect(
-                self.db_path, isolation_level=None, **self.connection_kwargs
+                self.db_path, isolation_level=None, **connection_kwargs
             )
 
     async def close_connection(self) -> None:
+        self._check_fork()
+        while self._commit_task is not None:
+            await asyncio.shield(self._commit_task)
         if self.connection:
             await self.connection.close()
             self.connection = None
 
     def ensure_connection(self) -> AsyncConnectionWrapper[aiosqlite.Connection]:
+        self._check_fork()
         return AsyncConnectionWrapper(self, self._lock)
 
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        self._lock = asyncio.Lock()
+        self._writes = []
+        self._commit_task = None
+
     async def _execute(self, query, args=()):
+        if self.group_commit_delay is not None and WRITE_QUERY_RE.match(query):
+            return await self._group_write(query, args, False)
         async with self.ensure_connection() as connection:
             return await connection.execute(query, args)
 
+    async def _execute_insert(self, query, args):
+        if self.group_commit_delay is None:
+            return await super()._execute_insert(query, args)
+        return [row[0] for row in await self._group_write(query, args, True)]
+
+    def _group_write(
+        self, query: str, args: ty.Sequence[ty.Any], fetch: bool
+    ) -> asyncio.Future:
+        """
+        Schedules write query to be committed with other queries
+        collected during `group_commit_delay`.
+        :param fetch: return rows instead of cursor.
+        :returns: future with result of query.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._writes.append((query, args, fetch, future))
+        if self._commit_task is None:
+            self._commit_task = asyncio.ensure_future(self._commit_writes())
+        return future
+
+    async def _commit_writes(self) -> None:
+        """
+        Waits `group_commit_delay` and commits collected queries.
+        Queries scheduled during commit are committed by the next task.
+        """
+        try:
+            await asyncio.sleep(self.group_commit_delay)
+            writes, self._writes = self._writes, []
+            await self._commit(writes)
+        except asyncio.CancelledError:
+            writes, self._writes = self._writes, []
+            for *_, future in writes:
+                future.cancel()
+            raise
+        finally:
+            self._commit_task = None
+            if self._writes:
+                self._commit_task = asyncio.ensure_future(
+                    self._commit_writes()
+                )
+
+    async def _commit(
+        self, writes: list[tuple[str, ty.Sequence, bool, asyncio.Future]]
+    ) -> None:
+        """
+        Executes queries in one transaction.
+        Failed query is rolled back by sqlite itself and its error
+        is passed to its caller, other queries are committed.
+        """
+        results: list[ty.Any] = []
+        try:
+            async with self.ensure_connection() as connection:
+                try:
+                    await connection.execute("BEGIN IMMEDIATE")
+                    for query, args, fetch, _ in writes:
+                        try:
+                            if fetch:
+                                result = list(
+                                    await connection.execute_fetchall(
+                                        query, args
+                                    )
+                                )
+                            else:
+                                result = await connection.execute(query, args)
+                        except Exception as exc:
+                            if not connection.in_transaction:
+                                raise  # transaction was rolled back
+                            result = exc
+                        results.append(result)
+                    await connection.execute("COMMIT")
+                except Exception:
+                    if connection.in_transaction:
+                        await connection.execute("ROLLBACK")
+                    raise
+                except BaseException:
+                    # cancelled: aiosqlite thread executes queries in order,
+                    # so rollback runs after the interrupted query
+                    with suppress(Exception):
+                        await connection.execute("ROLLBACK")
+                    raise
+        except Exception as exc:
+            results = [exc] * len(writes)
+        except BaseException:
+            for *_, future in writes:
+                future.cancel()
+            raise
+        for (*_, future), result in zip(writes, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _execute_batch(self, queries):
+        async with self.ensure_connection() as connection:
+            await connection.execute("BEGIN")
+            try:
+                for query, args in queries:
+                    try:
+                        await connection.executemany(query, args)
+                    except Exception as e:
+                        raise self._translate_exception(e, query, args)
+            except BaseException:
+                # also cancelled, rollback runs after the interrupted query
+                with suppress(Exception):
+                    await connection.execute("ROLLBACK")
+                raise
+            await connection.execute("COMMIT")
+
     async def executescript(self, query):
         async with self.ensure_connection() as connection:
             return await connection.executescript(query)
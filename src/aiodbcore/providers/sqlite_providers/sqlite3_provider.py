@@ -21,23 +21,44 @@ class Sqlite3Provider(BaseSyncProvider[sqlite3.Connection]):
         self._lock = threading.Lock()
 
     def create_connection(self) -> None:
+        self._check_fork()
         if not self.connection:
             self.connection = sqlite3.connect(
                 self.db_path, isolation_level=None, **self.connection_kwargs
             )
 
     def close_connection(self) -> None:
+        self._check_fork()
         if self.connection:
             self.connection.close()
             self.connection = None
 
     def ensure_connection(self) -> SyncConnectionWrapper[sqlite3.Connection]:
+        self._check_fork()
         return SyncConnectionWrapper(self, self._lock)
 
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        self._lock = threading.Lock()
+
     def _execute(self, query, args=()):
         with self.ensure_connection() as connection:
             return connection.execute(query, args)
 
+    def _execute_batch(self, queries):
+        with self.ensure_connection() as connection:
+            connection.execute("BEGIN")
+            try:
+                for query, args in queries:
+                    try:
+                        connection.executemany(query, args)
+                    except Exception as e:
+                        raise self._translate_exception(e, query, args)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
     def executescript(self, query):
         with self.ensure_connection() as connection:
             return connection.executescript(query)
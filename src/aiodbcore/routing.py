@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as ty
+
+STRATEGIES = ("round_robin", "least_busy")
+
+
+class ReplicaRouter:
+    """
+    Chooses replica for read queries of primary db.
+    Writes are executed by primary.
+    """
+
+    def __init__(
+        self,
+        replicas: ty.Sequence[str],
+        strategy: str = "round_robin",
+        sticky: float | None = None,
+    ):
+        """
+        :param replicas: names of replica dbs.
+        :param strategy: `round_robin` or `least_busy`
+            (replica with the least count of running queries).
+        :param sticky: reads go to primary within this count of seconds
+            after write, so changes are visible to the writer.
+            None - reads always go to replicas.
+        """
+        if not replicas:
+            raise ValueError("At least one replica should be specified")
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy `{strategy}`, "
+                f"use one of: {', '.join(STRATEGIES)}"
+            )
+        self.replicas = tuple(replicas)
+        self.strategy = strategy
+        self.sticky = sticky
+        self._next = 0
+        self._busy = dict.fromkeys(self.replicas, 0)
+        self._written_at: float | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str | None:
+        """
+        Chooses replica and marks it busy until `release`.
+        :returns: name of replica or None if query should go to primary.
+        """
+        if (
+            self.sticky is not None
+            and self._written_at is not None
+            and time.monotonic() - self._written_at < self.sticky
+        ):
+            return None
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self.replicas)
+            # rotation makes least busy replicas with equal load alternate
+            replicas = self.replicas[start:] + self.replicas[:start]
+            if self.strategy == "least_busy":
+                replica = min(replicas, key=self._busy.__getitem__)
+            else:
+                replica = replicas[0]
+            self._busy[replica] += 1
+        return replica
+
+    def release(self, replica: str) -> None:
+        with self._lock:
+            self._busy[replica] -= 1
+
+    def mark_write(self) -> None:
+        """
+        Starts sticky window.
+        """
+        if self.sticky is not None:
+            self._written_at = time.monotonic()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import copy
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from .core import BaseDBCore
+
+
+class IdentityMap:
+    """
+    Keeps one instance per (db, model, id).
+    Shards assign ids independently, so ids are mapped per db.
+    """
+
+    def __init__(self):
+        self._objs: dict[tuple[str, str, int], ty.Any] = {}
+
+    def get(self, db_name: str, model_name: str, obj_id: int) -> ty.Any | None:
+        return self._objs.get((db_name, model_name, obj_id))
+
+    def add(self, db_name: str, obj: ty.Any) -> ty.Any:
+        """
+        Registers `obj` in the map.
+        :param db_name: name of db which stores `obj`.
+        :returns: instance which is already registered with the same id
+            or `obj` itself.
+        """
+        if (obj_id := getattr(obj, "id", None)) is None:
+            return obj
+        return self._objs.setdefault(
+            (db_name, obj.__class__.__name__, obj_id), obj
+        )
+
+    def remove(self, db_name: str, model_name: str, obj_id: int) -> None:
+        self._objs.pop((db_name, model_name, obj_id), None)
+
+    def clear(self, model_name: str | None = None) -> None:
+        """
+        Forgets objects of model in all dbs.
+        """
+        if model_name is None:
+            self._objs.clear()
+            return
+        for key in [key for key in self._objs if key[1] == model_name]:
+            del self._objs[key]
+
+    def __contains__(self, key: tuple[str, str, int]) -> bool:
+        return key in self._objs
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+
+class Session[DBCore: BaseDBCore]:
+    """
+    Unit of work scope.
+    Inside the session rows with the same id resolve to the same instance
+    and saved objects are written in batches on flush.
+
+    >>> async with db.session() as s:
+    ...     orders = await s.fetchall(Order, join=LeftJoin(Customer, ...))
+    ...     orders[0][0].total += 10
+    ...     await s.save(orders[0][0])  # will be executed on exit
+    """
+
+    def __init__(self, db: DBCore):
+        self.identity_map = IdentityMap()
+        self.pending: dict[int, ty.Any] = {}  # {id(obj): obj}
+        self.db: DBCore = copy.copy(db)
+        self.db._session = self
+
+    def add(self, obj: ty.Any, db_name: str) -> None:
+        """
+        Marks `obj` to be saved on flush.
+        If other instance with the same id is loaded in the session,
+        values of `obj` are copied to it, so changes are not lost.
+        :param db_name: name of db which stores `obj`.
+        """
+        mapped = self.identity_map.add(db_name, obj)
+        if mapped is not obj:
+            signature = self.db.signatures[obj.__class__.__name__]
+            for field in signature.fields:
+                if field.is_loaded(obj):
+                    setattr(mapped, field.name, getattr(obj, field.name))
+        self.pending[id(mapped)] = mapped
+
+    def pop_pending(self) -> list[ty.Any]:
+        objs = list(self.pending.values())
+        self.pending.clear()
+        return objs
+
+    def restore_pending(self, objs: list[ty.Any]) -> None:
+        """
+        Puts back objects which were not written by failed flush.
+        """
+        for obj in objs:
+            self.pending.setdefault(id(obj), obj)
+
+    def __enter__(self) -> DBCore:
+        return self.db
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.db.flush()
+        self.pending.clear()
+        self.identity_map.clear()
+
+    async def __aenter__(self) -> DBCore:
+        return self.db
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.db.flush()
+        self.pending.clear()
+        self.identity_map.clear()
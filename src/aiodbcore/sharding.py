@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import bisect
+import typing as ty
+import zlib
+from abc import ABC, abstractmethod
+
+from .codecs import TaggedValue
+from .operators import (
+    AndOperator,
+    ContainedCmpOperator,
+    EqCmpOperator,
+    FieldRef,
+    OrOperator,
+    Subquery,
+)
+
+if ty.TYPE_CHECKING:
+    from .models import Field
+    from .operators import Operator
+
+
+class ShardMap[T](ABC):
+    """
+    Distributes rows of model between dbs by value of shard key field.
+    """
+
+    def __init__(self, field: Field[T], shards: ty.Sequence[str]):
+        """
+        :param field: shard key, e.g. `Tenant.id`.
+        :param shards: names of dbs passed to `init`.
+        """
+        if not shards:
+            raise ValueError("At least one shard should be specified")
+        self.field = field
+        self.shards = tuple(shards)
+
+    @property
+    def model_name(self) -> str:
+        return self.field.model_name
+
+    @abstractmethod
+    def get_shard(self, value: T) -> str:
+        """
+        :param value: value of shard key.
+        :returns: name of db that stores rows with this value.
+        """
+
+    def get_object_shard(self, obj: ty.Any) -> str:
+        return self.get_shard(getattr(obj, self.field.name))
+
+    def get_query_shards(self, where: Operator | None) -> set[str] | None:
+        """
+        Finds shards by conditions on shard key
+        (`==` and `contained` joined by `&` and `|`).
+        :returns: names of dbs that can store matching rows
+            or None if any shard can.
+        """
+        if isinstance(where, AndOperator):
+            first = self.get_query_shards(where.first_operand)
+            second = self.get_query_shards(where.second_operand)
+            if first is None or second is None:
+                return first if second is None else second
+            return first & second
+        if isinstance(where, OrOperator):
+            first = self.get_query_shards(where.first_operand)
+            second = self.get_query_shards(where.second_operand)
+            if first is None or second is None:
+                return None
+            return first | second
+        if (
+            isinstance(where, EqCmpOperator | ContainedCmpOperator)
+            and where.field_name == str(self.field)
+            and not isinstance(where.value, FieldRef | Subquery)
+        ):
+            if isinstance(where, EqCmpOperator):
+                return {self.get_shard(_unwrap(where.value))}
+            return {self.get_shard(_unwrap(value)) for value in where.value}
+        return None
+
+
+class HashShardMap[T](ShardMap[T]):
+    """
+    Shard is chosen by CRC32 of shard key.
+    Note: changing count of shards moves most of the rows.
+    """
+
+    def get_shard(self, value: T) -> str:
+        return self.shards[zlib.crc32(str(value).encode()) % len(self.shards)]
+
+
+class RangeShardMap[T](ShardMap[T]):
+    """
+    Shard is chosen by range of shard key.
+
+    >>> RangeShardMap(Tenant.id, [1000, 2000], ["shard1", "shard2", "shard3"])
+
+    Rows with id < 1000 are stored in `shard1`,
+    1000 <= id < 2000 - in `shard2`, id >= 2000 - in `shard3`.
+    """
+
+    def __init__(
+        self,
+        field: Field[T],
+        bounds: ty.Sequence[T],
+        shards: ty.Sequence[str],
+    ):
+        """
+        :param field: shard key.
+        :param bounds: sorted lower bounds of all shards except the first.
+        :param shards: names of dbs, one more than bounds.
+        """
+        super().__init__(field, shards)
+        if len(self.shards) != len(bounds) + 1:
+            raise ValueError("Count of shards should be count of bounds + 1")
+        if list(bounds) != sorted(bounds):
+            raise ValueError("Bounds should be sorted")
+        self.bounds = list(bounds)
+
+    def get_shard(self, value: T) -> str:
+        return self.shards[bisect.bisect_right(self.bounds, value)]
+
+
+def _unwrap(value: ty.Any) -> ty.Any:
+    """
+    :returns: value of shard key without tag of union type.
+    """
+    return value.value if isinstance(value, TaggedValue) else value
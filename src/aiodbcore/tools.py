@@ -40,7 +40,9 @@ def watch_changes(_cls: ty.Type | None = None, hash_func=hashlib.md5):
             hf = getattr(obj, "__wc_hash_func")
             hashes: dict[str, str] = {}
             for varname, value in obj.__dict__.items():
-                if not varname.startswith("_"):
+                if not varname.startswith("_") and not isinstance(
+                    value, LazyValue
+                ):
                     hashes[varname] = hf(str(value).encode()).hexdigest()
             setattr(obj, "__wc_hashes", hashes)
 
@@ -78,7 +80,7 @@ def has_changes(obj: ty.Any) -> bool:
     return any(
         hashes.get(varname, None) != hash_func(str(value).encode()).hexdigest()
         for varname, value in obj.__dict__.items()
-        if not varname.startswith("_")
+        if not varname.startswith("_") and not isinstance(value, LazyValue)
     )
 
 
@@ -97,12 +99,48 @@ def get_changed_attributes(obj: ty.Any) -> tuple[str, ...]:
         for varname, value in obj.__dict__.items()
         if (
             not varname.startswith("_")
+            and not isinstance(value, LazyValue)
             and hashes.get(varname, None)
             != hash_func(str(value).encode()).hexdigest()
         )
     )
 
 
+def update_hash(obj: ty.Any, varname: str) -> None:
+    """
+    Saves hash of current value of attribute,
+    so the value is considered unchanged.
+    :param obj: instance of class that wrapped by `watch_changes`.
+    :param varname: name of attribute.
+    """
+    hashes = getattr(obj, "__wc_hashes", None)
+    hash_func = getattr(obj, "__wc_hash_func", None)
+    if hashes is None or hash_func is None:
+        raise ValueError(f"{obj} is not `watch_changes` object")
+    hashes[varname] = hash_func(
+        str(obj.__dict__[varname]).encode()
+    ).hexdigest()
+
+
+class LazyValue:
+    """
+    Raw value that is decoded on first access.
+    Attributes with not loaded values are ignored by `watch_changes`.
+    """
+
+    __slots__ = ("raw", "decoder")
+
+    def __init__(self, raw: ty.Any, decoder: ty.Callable[[ty.Any], ty.Any]):
+        self.raw = raw
+        self.decoder = decoder
+
+    def load(self) -> ty.Any:
+        return self.decoder(self.raw)
+
+    def __repr__(self):
+        return "<not loaded>"
+
+
 class Construct[T](ty.Protocol):
     def __call__(self, *args, **kwargs) -> T: ...
 
@@ -115,6 +153,22 @@ def is_dt_type(obj: ty.Any) -> ty.TypeGuard[DTConstruct]:
     return obj in {datetime, date, time}
 
 
+JSON_TYPES = {dict, list}
+
+
+def is_json_type(python_type: ty.Any) -> bool:
+    """
+    :returns: `True` if values of the type are stored as JSON.
+        dicts, lists, dataclasses and optional of them.
+    """
+    if (types := getattr(python_type, "types", None)) is not None:
+        # `models.UnionType`, unions of several types are stored with tag
+        return len(types) == 1 and is_json_type(types[0])
+    if isinstance(python_type, type):
+        return python_type in JSON_TYPES or dataclasses.is_dataclass(python_type)
+    return ty.get_origin(python_type) in JSON_TYPES
+
+
 def convert_type[T](obj: ty.Any, python_type: Construct[T]) -> T:
     if is_dt_type(python_type):
         return python_type.fromisoformat(obj)
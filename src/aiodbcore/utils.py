@@ -1,11 +1,16 @@
 import typing as ty
 
 from .models import Field
-from .operators import ContainedCmpOperator, IsNullCmpOperator
+from .operators import (
+    ContainedCmpOperator,
+    ExistsOperator,
+    IsNullCmpOperator,
+    Subquery,
+)
 
 
 def contains[T](
-    field: Field[T], collection: list[T] | tuple[T, ...]
+    field: Field[T], collection: list[T] | tuple[T, ...] | Subquery
 ) -> ContainedCmpOperator:
     if not isinstance(field, Field):
         raise ValueError("first argument must be field of registered model")
@@ -18,6 +23,15 @@ def is_null(field: Field) -> IsNullCmpOperator:
     return field.is_null()
 
 
+def exists(subquery: Subquery) -> ExistsOperator:
+    """
+    >>> exists(db.subquery(Order.id, where=Order.user_id == User.id))
+    """
+    if not isinstance(subquery, Subquery):
+        raise ValueError("argument must be subquery prepared by `subquery`")
+    return ExistsOperator(subquery)
+
+
 def group_by[FT, T: ty.Any | tuple](
     field: Field[FT], objs: list[T]
 ) -> dict[FT, list[T]]:
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import typing as ty
+from contextlib import suppress
+
+if ty.TYPE_CHECKING:
+    from .core_async import AsyncDBCore
+
+
+class BufferedWriter[Model]:
+    """
+    Inserts objects in background by chunks.
+    `put` returns without waiting for db, it waits only when buffer is full.
+    Rows are written when `max_rows` objects are collected
+    or `max_delay` seconds after the first of them.
+    Objects get ids if they are written by multi-row inserts,
+    objects written by `COPY` (PostgreSQL) don't get ids.
+    If a chunk fails, its objects are not written (except ones written
+    to other shards), other chunks are written. Error is raised
+    by the next `put`, `flush` or `close`, `ExceptionGroup`
+    if several chunks failed.
+
+    >>> writer = db.buffered_writer(Event, max_rows=5000, max_delay=0.5)
+    >>> await writer.put(Event(kind="click"))
+    >>> await writer.close()  # or `db.close_connections()`
+    """
+
+    def __init__(
+        self,
+        db: AsyncDBCore,
+        model: ty.Type[Model],
+        max_rows: int = 1000,
+        max_delay: float = 1.0,
+    ):
+        """
+        :param db: db used to insert objects.
+        :param model: model of objects.
+        :param max_rows: size of buffer.
+        :param max_delay: max time in seconds object stays in buffer.
+        """
+        if max_rows <= 0:
+            raise ValueError("max_rows must be positive")
+        self.db = db
+        self.model = model
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self._buffer: list[Model] = []
+        self._errors: list[Exception] = []
+        self._has_rows = asyncio.Event()  # buffer is not empty
+        self._write_now = asyncio.Event()  # buffer is full or flush requested
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._idle = asyncio.Event()  # all objects are written
+        self._idle.set()
+        self._task = self.loop.create_task(self._run())
+
+    async def put(self, obj: Model) -> None:
+        """
+        Adds object to buffer. Waits for space if buffer is full.
+        :raises: error of previous write.
+        """
+        self._check()
+        while len(self._buffer) >= self.max_rows:
+            await self._has_space.wait()
+            self._check()
+        self._buffer.append(obj)
+        self._idle.clear()
+        self._has_rows.set()
+        if len(self._buffer) >= self.max_rows:
+            self._has_space.clear()
+            self._write_now.set()
+
+    async def flush(self) -> None:
+        """
+        Writes buffered objects and waits for the end of writing.
+        :raises: error of write.
+        """
+        if self._buffer:
+            self._write_now.set()
+        await self._idle.wait()
+        self._raise_error()
+
+    async def close(self) -> None:
+        """
+        Writes buffered objects and stops background task.
+        :raises: error of write.
+        """
+        if not self.closed:
+            self.closed = True
+            self._has_rows.set()
+            self._write_now.set()
+            await self._task
+        self._raise_error()
+
+    def _check(self) -> None:
+        if self.closed:
+            raise RuntimeError("Writer is closed")
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if not (errors := self._errors):
+            return
+        self._errors = []
+        if len(errors) == 1:
+            raise errors[0]
+        raise ExceptionGroup(f"{len(errors)} writes failed", errors)
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_rows.wait()
+            if not self.closed:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._write_now.wait(), self.max_delay
+                    )
+            objs, self._buffer = self._buffer, []
+            self._has_rows.clear()
+            self._write_now.clear()
+            self._has_space.set()
+            if objs:
+                await self._write(objs)
+            if not self._buffer:
+                self._idle.set()
+                if self.closed:
+                    return
+
+    async def _write(self, objs: list[Model]) -> None:
+        """
+        Inserts objects by `COPY` if provider supports it
+        or by multi-row inserts. Errors of chunks are collected.
+        """
+        db = self.db
+        provider = db.provider
+        if provider.SUPPORTS_COPY and db._split_by_shard(objs) is None:
+            try:
+                await provider.copy_records(*db._prepare_copy_records(objs))
+            except Exception as exc:
+                self._errors.append(exc)
+            else:
+                db._after_write(self.model, ())
+            return
+        signature = db.signatures[self.model.__name__]
+        chunk_size = max(
+            1, provider.MAX_QUERY_PARAMS // max(1, len(signature.fields) - 1)
+        )
+        for i in range(0, len(objs), chunk_size):
+            try:
+                await db.insert(objs[i : i + chunk_size])
+            except Exception as exc:
+                self._errors.append(exc)